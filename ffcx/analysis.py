@@ -99,7 +99,7 @@ def analyze_ufl_objects(
     for original_expression, points in expressions:
         elements += ufl.algorithms.extract_elements(original_expression)
         processed_expression = _analyze_expression(original_expression, scalar_type)
-        processed_expressions += [(processed_expression, points, original_expression)]
+        processed_expressions.append((processed_expression, points, original_expression))
 
     elements += ufl.algorithms.analysis.extract_sub_elements(elements)
 
@@ -202,15 +202,17 @@ def _analyze_form(
         for i, integral in enumerate(integral_data.integrals):
             metadata = integral.metadata()
 
+            # Extract the elements once, traversing the integrand is expensive
+            elements = ufl.algorithms.extract_elements(integral)
+
             # Vertex integrals do not support discontinuous integrands.
             if integral.integral_type() == "vertex":
-                elements = ufl.algorithms.extract_elements(integral)
                 if any(e.discontinuous for e in elements):
                     raise TypeError("Vertex integrals not supported for discontinuous elements.")
 
             # If form contains a quadrature element, use the custom quadrature scheme
             custom_q = None
-            for e in ufl.algorithms.extract_elements(integral):
+            for e in elements:
                 if e.has_custom_quadrature:
                     if custom_q is None:
                         custom_q = e.custom_quadrature()
@@ -228,13 +230,13 @@ def _analyze_form(
                 # Sending in a negative quadrature degree means that we want to be
                 # able to customize it at a later stage.
                 if qd < 0:
-                    qd = int(np.max(integral.metadata()["estimated_polynomial_degree"]))
+                    qd = int(np.max(metadata["estimated_polynomial_degree"]))
                 # Extract quadrature rule
-                qr = integral.metadata().get("quadrature_rule", "default")
+                qr = metadata.get("quadrature_rule", "default")
 
-                logger.info(f"Integral {i}, integral group {id}:")
-                logger.info(f"--- quadrature rule: {qr}")
-                logger.info(f"--- quadrature degree: {qd}")
+                logger.info("Integral %s, integral group %s:", i, id)
+                logger.info("--- quadrature rule: %s", qr)
+                logger.info("--- quadrature degree: %s", qd)
 
                 metadata.update({"quadrature_degree": qd, "quadrature_rule": qr})
             else:
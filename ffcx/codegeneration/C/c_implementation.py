@@ -5,6 +5,7 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """C implementation."""
 
+import functools
 import warnings
 
 import numpy as np
@@ -142,6 +143,42 @@ math_table = {
 }
 
 
+def _format_number(x):
+    """Format a number."""
+    # Use 16sf for precision (good for float64 or less)
+    if isinstance(x, complex):
+        return f"({x.real:.16}+I*{x.imag:.16})"
+    elif isinstance(x, float):
+        return f"{x:.16}"
+    return str(x)
+
+
+def _build_nested_initializer_lists(values, ndim: int) -> str:
+    """Build initializer lists from nested lists of Python scalars."""
+    if ndim == 1:
+        return "{" + ", ".join(_format_number(v) for v in values) + "}"
+    elif ndim > 1:
+        rows = (_build_nested_initializer_lists(v, ndim - 1) for v in values)
+        return "{" + ",\n  ".join(rows) + "}"
+    return "{}"
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_initializer_lists(dtype: str, shape: tuple[int, ...], data: bytes) -> str:
+    """Build (and cache) initializer lists from the raw data of an array.
+
+    The same tables are declared in the kernels of all integrals using
+    them, so they only need to be formatted once.
+    """
+    values = np.frombuffer(data, dtype=dtype).reshape(shape)
+    return _build_nested_initializer_lists(values.tolist(), len(shape))
+
+
+def _indent(code: str) -> str:
+    """Indent the non-empty lines of a block of code by one level."""
+    return "".join(f"  {line}\n" for line in code.split("\n") if line)
+
+
 class CFormatter:
     """C formatter."""
 
@@ -153,32 +190,40 @@ class CFormatter:
         self.scalar_type = np.dtype(dtype)
         self.real_type = dtype_to_scalar_dtype(dtype)
 
+        # Resolve the type dependent names once per formatter
+        self._c_type_names = {
+            L.DataType.SCALAR: dtype_to_c_type(self.scalar_type),
+            L.DataType.REAL: dtype_to_c_type(self.real_type),
+            L.DataType.INT: "int",
+            L.DataType.BOOL: "bool",
+        }
+
+    @functools.cached_property
+    def _scalar_math_table(self) -> dict[str, str]:
+        """Math function names for scalar type arguments."""
+        return math_table[self.scalar_type.name]
+
+    @functools.cached_property
+    def _real_math_table(self) -> dict[str, str]:
+        """Math function names for real type arguments."""
+        return math_table[self.real_type.name]
+
     def _dtype_to_name(self, dtype) -> str:
         """Convert dtype to C name."""
-        if dtype == L.DataType.SCALAR:
-            return dtype_to_c_type(self.scalar_type)
-        if dtype == L.DataType.REAL:
-            return dtype_to_c_type(self.real_type)
-        if dtype == L.DataType.INT:
-            return "int"
-        if dtype == L.DataType.BOOL:
-            return "bool"
-        raise ValueError(f"Invalid dtype: {dtype}")
-
-    def _format_number(self, x):
-        """Format a number."""
-        # Use 16sf for precision (good for float64 or less)
-        if isinstance(x, complex):
-            return f"({x.real:.16}+I*{x.imag:.16})"
-        elif isinstance(x, float):
-            return f"{x:.16}"
-        return str(x)
+        try:
+            return self._c_type_names[dtype]
+        except KeyError:
+            raise ValueError(f"Invalid dtype: {dtype}") from None
 
     def _build_initializer_lists(self, values):
         """Build initializer lists."""
+        if values.dtype.kind in "iu" or values.dtype in (np.float64, np.complex128):
+            # Formatting Python scalars is much faster than iterating over numpy
+            # scalars, and gives identical output for these types
+            return _cached_initializer_lists(values.dtype.str, values.shape, values.tobytes())
         arr = "{"
         if len(values.shape) == 1:
-            arr += ", ".join(self._format_number(v) for v in values)
+            arr += ", ".join(_format_number(v) for v in values)
         elif len(values.shape) > 1:
             arr += ",\n  ".join(self._build_initializer_lists(v) for v in values)
         arr += "}"
@@ -201,13 +246,10 @@ class CFormatter:
 
         body = ""
         if len(section.statements) > 0:
-            declarations += "{\n  "
             body = "".join(self.c_format(s) for s in section.statements)
-            body = body.replace("\n", "\n  ")
-            body = body[:-2] + "}\n"
+            body = "{\n  " + body.replace("\n", "\n  ")[:-2] + "}\n"
 
-        body += "// ------------------------ \n"
-        return str(comments + declarations + body)
+        return f"{comments}{declarations}{body}// ------------------------ \n"
 
     def format_comment(self, c: L.Comment) -> str:
         """Format a comment."""
@@ -243,13 +285,13 @@ class CFormatter:
 
     def format_nary_op(self, oper) -> str:
         """Format an n-ary operation."""
-        # Format children
-        args = [self.c_format(arg) for arg in oper.args]
-
-        # Apply parentheses
-        for i in range(len(args)):
-            if oper.args[i].precedence >= oper.precedence:
-                args[i] = "(" + args[i] + ")"
+        # Format children, applying parentheses
+        c_format = self.c_format
+        precedence = oper.precedence
+        args = (
+            f"({c_format(arg)})" if arg.precedence >= precedence else c_format(arg)
+            for arg in oper.args
+        )
 
         # Return combined string
         return f" {oper.op} ".join(args)
@@ -278,7 +320,7 @@ class CFormatter:
 
     def format_literal_float(self, val) -> str:
         """Format a literal float."""
-        value = self._format_number(val.value)
+        value = _format_number(val.value)
         return f"{value}"
 
     def format_literal_int(self, val) -> str:
@@ -290,14 +332,8 @@ class CFormatter:
         begin = self.c_format(r.begin)
         end = self.c_format(r.end)
         index = self.c_format(r.index)
-        output = f"for (int {index} = {begin}; {index} < {end}; ++{index})\n"
-        output += "{\n"
-        body = self.c_format(r.body)
-        for line in body.split("\n"):
-            if len(line) > 0:
-                output += f"  {line}\n"
-        output += "}\n"
-        return output
+        body = _indent(self.c_format(r.body))
+        return f"for (int {index} = {begin}; {index} < {end}; ++{index})\n{{\n{body}}}\n"
 
     def format_statement(self, s) -> str:
         """Format a statement."""
@@ -338,15 +374,13 @@ class CFormatter:
     def format_math_function(self, c) -> str:
         """Format a mathematical function."""
         # Get a table of functions for this type, if available
-        arg_type = self.scalar_type
+        dtype_math_table = self._scalar_math_table
         if hasattr(c.args[0], "dtype"):
             if c.args[0].dtype == L.DataType.REAL:
-                arg_type = self.real_type
+                dtype_math_table = self._real_math_table
         else:
             warnings.warn(f"Syntax item without dtype {c.args[0]}")
 
-        dtype_math_table = math_table[arg_type.name]
-
         # Get a function from the table, if available, else just use bare name
         func = dtype_math_table.get(c.function, c.function)
         args = ", ".join(self.c_format(arg) for arg in c.args)
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import logging
+from string import Formatter
 
 import numpy as np
 
@@ -20,15 +21,20 @@ from ffcx.ir.representation import ExpressionIR
 
 logger = logging.getLogger("ffcx")
 
+# Fields of the factory template, parsed once
+_factory_fields = {
+    fname for _, fname, _, _ in Formatter().parse(expressions_template.factory) if fname
+}
+
 
 def generator(ir: ExpressionIR, options):
     """Generate UFC code for an expression."""
     logger.info("Generating code for expression:")
     assert len(ir.expression.integrand) == 1, "Expressions only support single quadrature rule"
     points = next(iter(ir.expression.integrand))[1].points
-    logger.info(f"--- points: {points}")
+    logger.info("--- points: %s", points)
     factory_name = ir.expression.name
-    logger.info(f"--- name: {factory_name}")
+    logger.info("--- name: %s", factory_name)
 
     # Format declaration
     declaration = expressions_template.declaration.format(
@@ -106,10 +112,7 @@ def generator(ir: ExpressionIR, options):
     d["coordinate_element_hash"] = f"UINT64_C({ir.expression.coordinate_element_hash})"
 
     # Check that no keys are redundant or have been missed
-    from string import Formatter
-
-    fields = [fname for _, fname, _, _ in Formatter().parse(expressions_template.factory) if fname]
-    assert set(fields) == set(d.keys()), "Mismatch between keys in template and in formatting dict"
+    assert _factory_fields == d.keys(), "Mismatch between keys in template and in formatting dict"
 
     # Format implementation code
     implementation = expressions_template.factory.format_map(d)
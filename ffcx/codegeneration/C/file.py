@@ -20,6 +20,12 @@ from ffcx.codegeneration.C import file_template
 
 logger = logging.getLogger("ffcx")
 
+# The file footers have no fields to fill in, so are formatted once
+_code_post = (
+    file_template.declaration_post.format(),
+    file_template.implementation_post.format(),
+)
+
 
 def generator(options):
     """Generate UFC code for file output."""
@@ -30,7 +36,7 @@ def generator(options):
     d["options"] = textwrap.indent(pprint.pformat(options), "//  ")
     extra_c_includes = []
     if np.issubdtype(options["scalar_type"], np.complexfloating):
-        extra_c_includes += ["complex.h"]
+        extra_c_includes.append("complex.h")
     d["extra_c_includes"] = "\n".join(f"#include <{header}>" for header in extra_c_includes)
 
     # Format declaration code
@@ -39,10 +45,4 @@ def generator(options):
         file_template.implementation_pre.format_map(d),
     )
 
-    # Format implementation code
-    code_post = (
-        file_template.declaration_post.format_map(d),
-        file_template.implementation_post.format_map(d),
-    )
-
-    return code_pre, code_post
+    return code_pre, _code_post
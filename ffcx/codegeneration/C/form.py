@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import logging
+from string import Formatter
 
 import numpy as np
 
@@ -21,12 +22,15 @@ from ffcx.ir.representation import FormIR
 
 logger = logging.getLogger("ffcx")
 
+# Fields of the factory template, parsed once
+_factory_fields = {fname for _, fname, _, _ in Formatter().parse(form_template.factory) if fname}
+
 
 def generator(ir: FormIR, options):
     """Generate UFCx code for a form."""
     logger.info("Generating code for form:")
-    logger.info(f"--- rank: {ir.rank}")
-    logger.info(f"--- name: {ir.name}")
+    logger.info("--- rank: %s", ir.rank)
+    logger.info("--- name: %s", ir.name)
 
     d: dict[str, int | str] = {}
     d["factory_name"] = ir.name
@@ -36,7 +40,7 @@ def generator(ir: FormIR, options):
     d["num_coefficients"] = ir.num_coefficients
 
     if len(ir.original_coefficient_positions) > 0:
-        values = ", ".join(str(i) for i in ir.original_coefficient_positions)
+        values = ", ".join(map(str, ir.original_coefficient_positions))
         sizes = len(ir.original_coefficient_positions)
 
         d["original_coefficient_position_init"] = (
@@ -73,13 +77,12 @@ def generator(ir: FormIR, options):
             if len(shape) > 0
         ]
         names = [f"constant_shapes_{ir.name}_{i}" for i in range(ir.num_constants)]
-        shapes1 = f"static const int* constant_shapes_{ir.name}[{ir.num_constants}] = " + "{"
-        for rank, name in zip(ir.constant_ranks, names):
-            if rank > 0:
-                shapes1 += f"{name},\n"
-            else:
-                shapes1 += "NULL,\n"
-        shapes1 += "};"
+        entries = "".join(
+            f"{name},\n" if rank > 0 else "NULL,\n" for rank, name in zip(ir.constant_ranks, names)
+        )
+        shapes1 = (
+            f"static const int* constant_shapes_{ir.name}[{ir.num_constants}] = {{{entries}}};"
+        )
         shapes.append(shapes1)
 
         d["constant_shapes_init"] = "\n".join(shapes)
@@ -114,47 +117,29 @@ def generator(ir: FormIR, options):
         d["finite_element_hashes"] = "NULL"
         d["finite_element_hashes_init"] = ""
 
-    integrals = []
-    integral_ids = []
+    # The integrals and their ids, with one entry per domain of each integral
+    form_integrals = []
+    form_integral_ids = []
     integral_offsets = [0]
-    integral_domains = []
     # Note: the order of this list is defined by the enum ufcx_integral_type in ufcx.h
     for itg_type in ("cell", "exterior_facet", "interior_facet", "vertex", "ridge"):
-        unsorted_integrals = []
-        unsorted_ids = []
-        unsorted_domains = []
-        for name, domains, id in zip(
-            ir.integral_names[itg_type],
-            ir.integral_domains[itg_type],
-            ir.subdomain_ids[itg_type],
-        ):
-            unsorted_integrals += [f"&{name}"]
-            unsorted_ids += [id]
-            unsorted_domains += [domains]
-
-        id_sort = np.argsort(unsorted_ids)
-        integrals += [unsorted_integrals[i] for i in id_sort]
-        integral_ids += [unsorted_ids[i] for i in id_sort]
-        integral_domains += [unsorted_domains[i] for i in id_sort]
-
-        integral_offsets.append(sum(len(d) for d in integral_domains))
-
-    if len(integrals) > 0:
-        sizes = sum(len(domains) for domains in integral_domains)
-        values = ", ".join(
-            [
-                f"{i}_{domain.name}"
-                for i, domains in zip(integrals, integral_domains)
-                for domain in domains
-            ]
-        )
+        itg_names = ir.integral_names[itg_type]
+        itg_domains = ir.integral_domains[itg_type]
+        ids = ir.subdomain_ids[itg_type]
+        for i in np.argsort(ids):
+            for domain in itg_domains[i]:
+                form_integrals.append(f"&{itg_names[i]}_{domain.name}")
+                form_integral_ids.append(f"{ids[i]}")
+        integral_offsets.append(len(form_integrals))
+
+    if len(form_integrals) > 0:
+        sizes = len(form_integrals)
+        values = ", ".join(form_integrals)
         d["form_integrals_init"] = (
             f"static ufcx_integral* form_integrals_{ir.name}[{sizes}] = {{{values}}};"
         )
         d["form_integrals"] = f"form_integrals_{ir.name}"
-        values = ", ".join(
-            f"{i}" for i, domains in zip(integral_ids, integral_domains) for _ in domains
-        )
+        values = ", ".join(form_integral_ids)
         d["form_integral_ids_init"] = f"int form_integral_ids_{ir.name}[{sizes}] = {{{values}}};"
         d["form_integral_ids"] = f"form_integral_ids_{ir.name}"
     else:
@@ -164,16 +149,13 @@ def generator(ir: FormIR, options):
         d["form_integral_ids"] = "NULL"
 
     sizes = len(integral_offsets)
-    values = ", ".join(str(i) for i in integral_offsets)
+    values = ", ".join(map(str, integral_offsets))
     d["form_integral_offsets_init"] = (
         f"int form_integral_offsets_{ir.name}[{sizes}] = {{{values}}};"
     )
 
     # Check that no keys are redundant or have been missed
-    from string import Formatter
-
-    fields = [fname for _, fname, _, _ in Formatter().parse(form_template.factory) if fname]
-    assert set(fields) == set(d.keys()), "Mismatch between keys in template and in formatting dict"
+    assert _factory_fields == d.keys(), "Mismatch between keys in template and in formatting dict"
 
     # Format implementation code
     implementation = form_template.factory.format_map(d)
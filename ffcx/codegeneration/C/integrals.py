@@ -24,8 +24,8 @@ logger = logging.getLogger("ffcx")
 def generator(ir: IntegralIR, domain: basix.CellType, options):
     """Generate C code for an integral."""
     logger.info("Generating code for integral:")
-    logger.info(f"--- type: {ir.expression.integral_type}")
-    logger.info(f"--- name: {ir.expression.name}")
+    logger.info("--- type: %s", ir.expression.integral_type)
+    logger.info("--- name: %s", ir.expression.name)
 
     factory_name = f"{ir.expression.name}_{domain.name}"
 
@@ -51,10 +51,9 @@ def generator(ir: IntegralIR, domain: basix.CellType, options):
     if len(ir.enabled_coefficients) > 0:
         values = ", ".join("1" if i else "0" for i in ir.enabled_coefficients)
         sizes = len(ir.enabled_coefficients)
-        code["enabled_coefficients_init"] = (
-            f"bool enabled_coefficients_{ir.expression.name}_{domain.name}[{sizes}] = {{{values}}};"
-        )
-        code["enabled_coefficients"] = f"enabled_coefficients_{ir.expression.name}_{domain.name}"
+        enabled_coefficients = f"enabled_coefficients_{factory_name}"
+        code["enabled_coefficients_init"] = f"bool {enabled_coefficients}[{sizes}] = {{{values}}};"
+        code["enabled_coefficients"] = enabled_coefficients
     else:
         code["enabled_coefficients_init"] = ""
         code["enabled_coefficients"] = "NULL"
@@ -75,20 +74,13 @@ def generator(ir: IntegralIR, domain: basix.CellType, options):
     )
 
     assert ir.expression.coordinate_element_hash is not None
-    implementation = ufcx_integrals.factory.format(
-        factory_name=factory_name,
-        enabled_coefficients=code["enabled_coefficients"],
-        enabled_coefficients_init=code["enabled_coefficients_init"],
-        tabulate_tensor=code["tabulate_tensor"],
-        needs_facet_permutations="true" if ir.expression.needs_facet_permutations else "false",
-        scalar_type=dtype_to_c_type(options["scalar_type"]),
-        geom_type=dtype_to_c_type(dtype_to_scalar_dtype(options["scalar_type"])),
-        coordinate_element_hash=f"UINT64_C({ir.expression.coordinate_element_hash})",
-        tabulate_tensor_float32=code["tabulate_tensor_float32"],
-        tabulate_tensor_float64=code["tabulate_tensor_float64"],
-        tabulate_tensor_complex64=code["tabulate_tensor_complex64"],
-        tabulate_tensor_complex128=code["tabulate_tensor_complex128"],
-        domain=int(domain),
-    )
+    code["factory_name"] = factory_name
+    code["needs_facet_permutations"] = "true" if ir.expression.needs_facet_permutations else "false"
+    code["scalar_type"] = dtype_to_c_type(options["scalar_type"])
+    code["geom_type"] = dtype_to_c_type(dtype_to_scalar_dtype(options["scalar_type"]))
+    code["coordinate_element_hash"] = f"UINT64_C({ir.expression.coordinate_element_hash})"
+    code["domain"] = int(domain)
+
+    implementation = ufcx_integrals.factory.format_map(code)
 
     return declaration, implementation
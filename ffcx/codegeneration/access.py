@@ -14,7 +14,7 @@ import ufl
 import ffcx.codegeneration.lnodes as L
 from ffcx.definitions import entity_types
 from ffcx.ir.analysis.modified_terminals import ModifiedTerminal
-from ffcx.ir.elementtables import UniqueTableReferenceT
+from ffcx.ir.elementtables import UniqueTableReferenceT, is_quadrature_coefficient
 from ffcx.ir.representationutils import QuadratureRule
 
 logger = logging.getLogger("ffcx")
@@ -99,6 +99,13 @@ class FFCXBackendAccess:
             # array at dof begin (if mt is restricted, begin contains
             # cell offset)
             return self.symbols.coefficient_dof_access(mt.terminal, begin)
+        elif is_quadrature_coefficient(mt, tabledata, quadrature_rule):
+            # The table is the identity, so f(x_iq) = f_{iq}, just return
+            # direct reference to the dof of the current quadrature point
+            iq = self.symbols.quadrature_loop_index
+            return self.symbols.coefficient_dof_access(
+                mt.terminal, iq * tabledata.block_size + begin
+            )
         else:
             # Return symbol, see definitions for computation
             return self.symbols.coefficient_value(mt)
@@ -456,7 +463,7 @@ class FFCXBackendAccess:
                 qp = self.symbols.quadrature_permutation[1]
 
         if dof_index.dim == 1 and quadrature_index.dim == 1:
-            symbols += [L.Symbol(tabledata.name, dtype=L.DataType.REAL)]
+            symbols.append(L.Symbol(tabledata.name, dtype=L.DataType.REAL))
             return self.symbols.element_tables[tabledata.name][qp][entity][iq_global_index][
                 ic_global_index
             ], symbols
@@ -468,6 +475,6 @@ class FFCXBackendAccess:
                 iq_i = quadrature_index.local_index(i)
                 ic_i = dof_index.local_index(i)
                 table = self.symbols.element_tables[factor.name][qp][entity][iq_i][ic_i]
-                symbols += [L.Symbol(factor.name, dtype=L.DataType.REAL)]
+                symbols.append(L.Symbol(factor.name, dtype=L.DataType.REAL))
                 FE.append(table)
             return L.Product(FE), symbols
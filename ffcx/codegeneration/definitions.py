@@ -12,7 +12,7 @@ import ufl
 import ffcx.codegeneration.lnodes as L
 from ffcx.definitions import entity_types
 from ffcx.ir.analysis.modified_terminals import ModifiedTerminal
-from ffcx.ir.elementtables import UniqueTableReferenceT
+from ffcx.ir.elementtables import UniqueTableReferenceT, is_quadrature_coefficient
 from ffcx.ir.representationutils import QuadratureRule
 
 logger = logging.getLogger("ffcx")
@@ -145,6 +145,11 @@ class FFCXBackendDefinitions:
         if ttype == "ones" and end - begin == 1:
             return []
 
+        # For a coefficient evaluated at its own quadrature points we also reference the
+        # dofs directly
+        if is_quadrature_coefficient(mt, tabledata, quadrature_rule):
+            return []
+
         assert begin < end
 
         # Get access to element table
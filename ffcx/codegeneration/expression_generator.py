@@ -7,9 +7,10 @@
 
 import collections
 import logging
-from itertools import pairwise, product
+from itertools import product
 from typing import Any
 
+import numpy as np
 import ufl
 
 import ffcx.codegeneration.lnodes as L
@@ -88,7 +89,7 @@ class ExpressionGenerator:
 
         parts = []
         for i, cell_list in cells.items():
-            for c in cell_list:
+            for c in sorted(cell_list):
                 parts.append(geometry.write_table(ufl_geometry[i], c))
 
         return parts
@@ -105,7 +106,7 @@ class ExpressionGenerator:
             symbol = L.Symbol(name, dtype=L.DataType.REAL)
             self.backend.symbols.element_tables[name] = symbol
             decl = L.ArrayDecl(symbol, sizes=table.shape, values=table, const=True)
-            parts += [decl]
+            parts.append(decl)
 
         # Add leading comment if there are any tables
         parts = L.commented_code_list(
@@ -222,15 +223,7 @@ class ExpressionGenerator:
         iq = self.backend.symbols.quadrature_loop_index
 
         # Check if DOFs in dofrange are equally spaced.
-        expand_loop = False
-        for bm in blockmap:
-            for a, b in pairwise(bm):
-                if b - a != bm[1] - bm[0]:
-                    expand_loop = True
-                    break
-            else:
-                continue
-            break
+        expand_loop = any(len(bm) > 2 and np.any(np.diff(bm) != bm[1] - bm[0]) for bm in blockmap)
 
         if expand_loop:
             # If DOFs in dofrange are not equally spaced, then expand out the for loop
@@ -281,7 +274,7 @@ class ExpressionGenerator:
 
             for i in reversed(range(block_rank)):
                 body = L.ForRange(B_indices[i + 1], 0, blockdims[i], body=body)
-            quadparts += [body]
+            quadparts.append(body)
 
         return preparts, quadparts
 
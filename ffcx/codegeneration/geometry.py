@@ -5,6 +5,8 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """Geometry."""
 
+import functools
+
 import basix
 import numpy as np
 
@@ -12,30 +14,51 @@ import ffcx.codegeneration.lnodes as L
 
 
 def write_table(tablename, cellname):
-    """Write a table."""
+    """Write a table.
+
+    The table values only depend on the table name and the cell, so they
+    are computed once. A new declaration is built on every call, since the
+    code of a kernel is modified in place when it is optimised.
+    """
+    values = _table_values(tablename, cellname)
+    dtype = L.DataType.INT if tablename == "facet_edge_vertices" else L.DataType.REAL
+    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=dtype)
+    if tablename in ("reference_cell_volume", "reference_facet_volume"):
+        return L.VariableDecl(symbol, values)
+    return L.ArrayDecl(symbol, values=values, const=True)
+
+
+@functools.cache
+def _table_values(tablename, cellname):
+    """Compute (and cache) the values of a table."""
     if tablename == "facet_edge_vertices":
-        return facet_edge_vertices(tablename, cellname)
-    if tablename == "cell_facet_jacobian":
-        return cell_facet_jacobian(tablename, cellname)
-    if tablename == "cell_ridge_jacobian":
-        return cell_ridge_jacobian(tablename, cellname)
-    if tablename == "reference_cell_volume":
-        return reference_cell_volume(tablename, cellname)
-    if tablename == "reference_facet_volume":
-        return reference_facet_volume(tablename, cellname)
-    if tablename == "reference_cell_edge_vectors":
-        return reference_cell_edge_vectors(tablename, cellname)
-    if tablename == "reference_facet_edge_vectors":
-        return reference_facet_edge_vectors(tablename, cellname)
-    if tablename == "reference_normals":
-        return reference_normals(tablename, cellname)
-    if tablename == "facet_orientation":
-        return facet_orientation(tablename, cellname)
-    raise ValueError(f"Unknown geometry table name: {tablename}")
-
-
-def facet_edge_vertices(tablename, cellname):
-    """Write facet edge vertices."""
+        values = facet_edge_vertices(cellname)
+    elif tablename == "cell_facet_jacobian":
+        values = cell_facet_jacobian(cellname)
+    elif tablename == "cell_ridge_jacobian":
+        values = cell_ridge_jacobian(cellname)
+    elif tablename == "reference_cell_volume":
+        return reference_cell_volume(cellname)
+    elif tablename == "reference_facet_volume":
+        return reference_facet_volume(cellname)
+    elif tablename == "reference_cell_edge_vectors":
+        values = reference_cell_edge_vectors(cellname)
+    elif tablename == "reference_facet_edge_vectors":
+        values = reference_facet_edge_vectors(cellname)
+    elif tablename == "reference_normals":
+        values = reference_normals(cellname)
+    elif tablename == "facet_orientation":
+        values = facet_orientation(cellname)
+    else:
+        raise ValueError(f"Unknown geometry table name: {tablename}")
+
+    # The cached array is shared between all declarations of the table
+    values.setflags(write=False)
+    return values
+
+
+def facet_edge_vertices(cellname):
+    """Compute facet edge vertices."""
     celltype = getattr(basix.CellType, cellname)
     topology = basix.topology(celltype)
     triangle_edges = basix.topology(basix.CellType.triangle)[1]
@@ -53,59 +76,48 @@ def facet_edge_vertices(tablename, cellname):
         else:
             raise ValueError("Only triangular and quadrilateral faces supported.")
 
-    out = np.array(edge_vertices, dtype=int)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.INT)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    return np.array(edge_vertices, dtype=int)
 
 
-def cell_facet_jacobian(tablename, cellname):
-    """Write a reference facet jacobian."""
+def cell_facet_jacobian(cellname):
+    """Compute a reference facet jacobian."""
     celltype = getattr(basix.CellType, cellname)
-    out = basix.cell.facet_jacobians(celltype)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    return basix.cell.facet_jacobians(celltype)
 
 
-def cell_ridge_jacobian(tablename, cellname):
-    """Write a reference ridge jacobian."""
+def cell_ridge_jacobian(cellname):
+    """Compute a reference ridge jacobian."""
     celltype = getattr(basix.CellType, cellname)
-    out = basix.cell.edge_jacobians(celltype)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    return basix.cell.edge_jacobians(celltype)
 
 
-def reference_cell_volume(tablename, cellname):
-    """Write a reference cell volume."""
+def reference_cell_volume(cellname):
+    """Compute a reference cell volume."""
     celltype = getattr(basix.CellType, cellname)
-    out = basix.cell.volume(celltype)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.VariableDecl(symbol, out)
+    return basix.cell.volume(celltype)
 
 
-def reference_facet_volume(tablename, cellname):
-    """Write a reference facet volume."""
+def reference_facet_volume(cellname):
+    """Compute a reference facet volume."""
     celltype = getattr(basix.CellType, cellname)
     volumes = basix.cell.facet_reference_volumes(celltype)
     for i in volumes[1:]:
         if not np.isclose(i, volumes[0]):
             raise ValueError("Reference facet volume not supported for this cell type.")
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.VariableDecl(symbol, volumes[0])
+    return volumes[0]
 
 
-def reference_cell_edge_vectors(tablename, cellname):
-    """Write reference edge vectors."""
+def reference_cell_edge_vectors(cellname):
+    """Compute reference edge vectors."""
     celltype = getattr(basix.CellType, cellname)
     topology = basix.topology(celltype)
     geometry = basix.geometry(celltype)
-    edge_vectors = [geometry[j] - geometry[i] for i, j in topology[1]]
-    out = np.array(edge_vectors)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    edges = np.array(topology[1], dtype=int)
+    return geometry[edges[:, 1]] - geometry[edges[:, 0]]
 
 
-def reference_facet_edge_vectors(tablename, cellname):
-    """Write facet reference edge vectors."""
+def reference_facet_edge_vectors(cellname):
+    """Compute facet reference edge vectors."""
     celltype = getattr(basix.CellType, cellname)
     topology = basix.topology(celltype)
     geometry = basix.geometry(celltype)
@@ -115,33 +127,28 @@ def reference_facet_edge_vectors(tablename, cellname):
     if len(topology) != 4:
         raise ValueError("Can only get facet edges for 3D cells.")
 
-    edge_vectors = []
+    # Collect the vertex pairs of all facet edges, then take the differences at once
+    edges: list[tuple[int, int]] = []
     for facet in topology[-2]:
         if len(facet) == 3:
-            edge_vectors += [geometry[facet[j]] - geometry[facet[i]] for i, j in triangle_edges]
+            edges += [(facet[i], facet[j]) for i, j in triangle_edges]
         elif len(facet) == 4:
-            edge_vectors += [
-                geometry[facet[j]] - geometry[facet[i]] for i, j in quadrilateral_edges
-            ]
+            edges += [(facet[i], facet[j]) for i, j in quadrilateral_edges]
         else:
             raise ValueError("Only triangular and quadrilateral faces supported.")
 
-    out = np.array(edge_vectors)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    vertices = np.array(edges, dtype=int)
+    return geometry[vertices[:, 1]] - geometry[vertices[:, 0]]
 
 
-def reference_normals(tablename, cellname):
-    """Write reference facet normals."""
+def reference_normals(cellname):
+    """Compute reference facet normals."""
     celltype = getattr(basix.CellType, cellname)
-    out = basix.cell.facet_outward_normals(celltype)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=out, const=True)
+    return basix.cell.facet_outward_normals(celltype)
 
 
-def facet_orientation(tablename, cellname):
-    """Write facet orientations."""
+def facet_orientation(cellname):
+    """Compute facet orientations."""
     celltype = getattr(basix.CellType, cellname)
     out = basix.cell.facet_orientations(celltype)
-    symbol = L.Symbol(f"{cellname}_{tablename}", dtype=L.DataType.REAL)
-    return L.ArrayDecl(symbol, values=np.asarray(out), const=True)
+    return np.asarray(out)
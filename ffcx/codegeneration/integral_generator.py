@@ -186,11 +186,20 @@ class IntegralGenerator:
             return parts
 
         # Loop over quadrature rules
-        for (cell, quadrature_rule), _ in self.ir.expression.integrand.items():
+        for (cell, quadrature_rule), integrand in self.ir.expression.integrand.items():
             if domain == cell:
+                blocks = [
+                    blockdata
+                    for contributions in integrand["block_contributions"].values()
+                    for blockdata in contributions
+                ]
+                if self.is_point_invariant(quadrature_rule, blocks):
+                    # All blocks are integrated outside of the quadrature loop
+                    continue
+
                 # Generate quadrature weights array
                 wsym = self.backend.symbols.weights_table(quadrature_rule)
-                parts += [L.ArrayDecl(wsym, values=quadrature_rule.weights, const=True)]
+                parts.append(L.ArrayDecl(wsym, values=quadrature_rule.weights, const=True))
 
         # Add leading comment if there are any tables
         parts = L.commented_code_list(parts, "Quadrature rules")
@@ -223,7 +232,7 @@ class IntegralGenerator:
 
         parts = []
         for i, cell_list in cells.items():
-            for c in cell_list:
+            for c in sorted(cell_list):
                 parts.append(geometry.write_table(ufl_geometry[i], c))
 
         return parts
@@ -270,12 +279,19 @@ class IntegralGenerator:
 
     def generate_quadrature_loop(self, quadrature_rule: QuadratureRule, domain: basix.CellType):
         """Generate quadrature loop with for this quadrature_rule."""
+        # Generate blocks which do not vary over the quadrature points,
+        # these are placed before the quadloop
+        preparts = self.generate_point_invariant_blocks(quadrature_rule, domain)
+
         # Generate varying partition
         definitions, intermediates_0 = self.generate_varying_partition(quadrature_rule, domain)
 
         # Generate dofblock parts, some of this will be placed before or after quadloop
         tensor_comp, intermediates_fw = self.generate_dofblock_partition(quadrature_rule, domain)
         assert all([isinstance(tc, L.Section) for tc in tensor_comp])
+        if not tensor_comp:
+            # Everything has been integrated outside the quadloop
+            return preparts
 
         # Check if we only have Section objects
         inputs = []
@@ -288,9 +304,9 @@ class IntegralGenerator:
         declarations = []
         for fw in intermediates_fw:
             assert isinstance(fw, L.VariableDecl)
-            output += [fw.symbol]
-            declarations += [L.VariableDecl(fw.symbol, 0)]
-            intermediates_0 += [L.Assign(fw.symbol, fw.value)]
+            output.append(fw.symbol)
+            declarations.append(L.VariableDecl(fw.symbol, 0))
+            intermediates_0.append(L.Assign(fw.symbol, fw.value))
         intermediates = [L.Section("Intermediates", intermediates_0, declarations, inputs, output)]
 
         iq_symbol = self.backend.symbols.quadrature_loop_index
@@ -299,7 +315,38 @@ class IntegralGenerator:
         code = definitions + intermediates + tensor_comp
         code = optimize(code, quadrature_rule)
 
-        return [L.create_nested_for_loops([iq], code)]
+        return preparts + [L.create_nested_for_loops([iq], code)]
+
+    def generate_point_invariant_blocks(
+        self, quadrature_rule: QuadratureRule, domain: basix.CellType
+    ):
+        """Generate blocks whose factors and argument tables are constant over the points.
+
+        For such blocks (e.g. gradients of affine elements on affine cells) the sum over the
+        quadrature points reduces to a single evaluation scaled by the sum of the weights.
+        """
+        tensor_comp, intermediates_fw = self.generate_dofblock_partition(
+            quadrature_rule, domain, point_invariant=True
+        )
+        if not tensor_comp:
+            return []
+        tensor_comp = optimize(tensor_comp, quadrature_rule)
+        return L.commented_code_list(
+            intermediates_fw + tensor_comp, "Blocks integrated outside of the quadrature loop"
+        )
+
+    def is_point_invariant(self, quadrature_rule: QuadratureRule, blocklist: list[BlockDataT]):
+        """Check if a group of blocks is invariant over the quadrature points."""
+        if self.ir.expression.integral_type in ufl.custom_integral_types:
+            # Weights are only known at runtime
+            return False
+        if quadrature_rule.has_tensor_factors:
+            return False
+        return all(
+            blockdata.all_factors_piecewise
+            and all(mad.tabledata.is_piecewise for mad in blockdata.ma_data)
+            for blockdata in blocklist
+        )
 
     def generate_piecewise_partition(self, quadrature_rule, domain: basix.CellType):
         """Generate a piecewise partition."""
@@ -338,10 +385,10 @@ class IntegralGenerator:
 
                     if vdef:
                         assert isinstance(vdef, L.Section)
-                    # Only add if definition is unique.
-                    # This can happen when using sub-meshes
-                    if vdef not in definitions:
-                        definitions += [vdef]
+                        # Only add if definition is unique.
+                        # This can happen when using sub-meshes
+                        if vdef not in definitions:
+                            definitions.append(vdef)
                 else:
                     # Get previously visited operands
                     vops = [self.get_var(quadrature_rule, domain, op) for op in v.ufl_operands]
@@ -366,8 +413,13 @@ class IntegralGenerator:
         self,
         quadrature_rule: QuadratureRule,
         domain: basix.CellType,
+        point_invariant: bool = False,
     ):
-        """Generate a dofblock partition."""
+        """Generate a dofblock partition.
+
+        Only the block groups for which ``is_point_invariant`` matches
+        ``point_invariant`` are generated.
+        """
         block_contributions = self.ir.expression.integrand[(domain, quadrature_rule)][
             "block_contributions"
         ]
@@ -394,11 +446,14 @@ class IntegralGenerator:
 
         intermediates = []
         for blockmap in block_groups:
+            if self.is_point_invariant(quadrature_rule, block_groups[blockmap]) != point_invariant:
+                continue
             block_quadparts, intermediate = self.generate_block_parts(
                 quadrature_rule,
                 domain,
                 blockmap,
                 block_groups[blockmap],
+                point_invariant,
             )
             intermediates += intermediate
 
@@ -444,14 +499,15 @@ class IntegralGenerator:
         domain: basix.CellType,
         blockmap: tuple,
         blocklist: list[BlockDataT],
+        point_invariant: bool = False,
     ):
         """Generate and return code parts for a given block.
 
         Returns parts occurring before, inside, and after the quadrature
         loop identified by the quadrature rule.
 
-        Should be called with quadrature_rule=None for
-        quadloop-independent blocks.
+        If ``point_invariant`` is True, the quadrature weight is replaced by
+        the sum of the weights and the code is placed outside the quadrature loop.
         """
         # The parts to return
         quadparts: list[L.LNode] = []
@@ -502,6 +558,8 @@ class IntegralGenerator:
             if self.ir.expression.integral_type in ufl.custom_integral_types:
                 weights = self.backend.symbols.custom_weights_table
                 weight = weights[iq.global_index]
+            elif point_invariant:
+                weight = L.LiteralFloat(float(quadrature_rule.weights.sum()))
             else:
                 weights = self.backend.symbols.weights_table(quadrature_rule)
                 weight = weights[iq.global_index]
@@ -512,7 +570,12 @@ class IntegralGenerator:
                 fw = fw_rhs
             else:
                 # Define and cache scalar temp variable
-                key = (quadrature_rule, factor_index, blockdata.all_factors_piecewise)
+                key = (
+                    quadrature_rule,
+                    factor_index,
+                    blockdata.all_factors_piecewise,
+                    point_invariant,
+                )
                 fw, defined = self.get_temp_symbol("fw", key)
                 if not defined:
                     input = [f, weight]
@@ -524,10 +587,12 @@ class IntegralGenerator:
                     assert all(isinstance(i, L.Symbol) for i in input)
                     assert all(isinstance(o, L.Symbol) for o in output)
 
-                    intermediates += [L.VariableDecl(fw, fw_rhs)]
+                    intermediates.append(L.VariableDecl(fw, fw_rhs))
 
-            var = fw if isinstance(fw, L.Symbol) else fw.array
-            vars += [var]
+            if isinstance(fw, L.Symbol):
+                vars.append(fw)
+            elif isinstance(fw, L.ArrayAccess):
+                vars.append(fw.array)
             assert not blockdata.transposed, "Not handled yet"
 
             # Fetch code to access modified arguments
@@ -575,7 +640,7 @@ class IntegralGenerator:
         output = [A]
 
         # Make sure we don't have repeated symbols in input
-        input = list(set(input))
+        input = list(dict.fromkeys(input))
 
         # assert input and output are Symbol objects
         assert all(isinstance(i, L.Symbol) for i in input)
@@ -585,6 +650,6 @@ class IntegralGenerator:
         if len(B_indices) > 1:
             annotations.append(L.Annotation.licm)
 
-        quadparts += [L.Section("Tensor Computation", body, [], input, output, annotations)]
+        quadparts.append(L.Section("Tensor Computation", body, [], input, output, annotations))
 
         return quadparts, intermediates
@@ -98,7 +98,7 @@ def get_cached_module(module_name, object_names, cache_dir, timeout):
             pass
         return None, None
     except FileExistsError:
-        logger.info("Cached C file already exists: " + str(c_filename))
+        logger.info("Cached C file already exists: %s", c_filename)
         finder = importlib.machinery.FileFinder(
             str(cache_dir),
             (importlib.machinery.ExtensionFileLoader, importlib.machinery.EXTENSION_SUFFIXES),
@@ -117,7 +117,7 @@ def get_cached_module(module_name, object_names, cache_dir, timeout):
                 compiled_objects = [getattr(compiled_module.lib, name) for name in object_names]
                 return compiled_objects, compiled_module
 
-            logger.info(f"Waiting for {ready_name} to appear.")
+            logger.info("Waiting for %s to appear.", ready_name)
             time.sleep(1)
         raise TimeoutError(
             "JIT compilation timed out, probably due to a failed previous compile. "
@@ -401,7 +401,7 @@ def _compile_objects(
     if cffi_verbose:
         print(s)
 
-    logger.info(f"JIT C compiler finished in {time.time() - t0:.4f}")
+    logger.info("JIT C compiler finished in %.4f", time.time() - t0)
 
     # Create a "status ready" file. If this fails, it is an error,
     # because it should not exist yet.
@@ -61,25 +61,15 @@ class PRECEDENCE:
     LOWEST = 15
 
 
-def is_zero_lexpr(lexpr):
-    """Check if an expression is zero."""
-    return (isinstance(lexpr, LiteralFloat) and lexpr.value == 0.0) or (
-        isinstance(lexpr, LiteralInt) and lexpr.value == 0
-    )
+# Literal values that expressions are simplified for
+_special_literal_values = {0: 0, 1: 1, -1: -1}
 
 
-def is_one_lexpr(lexpr):
-    """Check if an expression is one."""
-    return (isinstance(lexpr, LiteralFloat) and lexpr.value == 1.0) or (
-        isinstance(lexpr, LiteralInt) and lexpr.value == 1
-    )
-
-
-def is_negative_one_lexpr(lexpr):
-    """Check if an expression is negative one."""
-    return (isinstance(lexpr, LiteralFloat) and lexpr.value == -1.0) or (
-        isinstance(lexpr, LiteralInt) and lexpr.value == -1
-    )
+def special_literal_value(lexpr):
+    """Return 0, 1 or -1 if the expression is that literal number, otherwise None."""
+    if isinstance(lexpr, LiteralFloat | LiteralInt):
+        return _special_literal_values.get(lexpr.value)
+    return None
 
 
 def float_product(factors):
@@ -87,7 +77,7 @@ def float_product(factors):
 
     Simplify ones and returning 1.0 if empty sequence.
     """
-    factors = [f for f in factors if not is_one_lexpr(f)]
+    factors = [f for f in factors if special_literal_value(f) != 1]
     if len(factors) == 0:
         return LiteralFloat(1.0)
     elif len(factors) == 1:
@@ -161,9 +151,9 @@ class LExpr(LNode):
     def __add__(self, other):
         """Add."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             return other
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             return self
         if isinstance(other, Neg):
             return Sub(self, other.arg)
@@ -172,9 +162,9 @@ class LExpr(LNode):
     def __radd__(self, other):
         """Add."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             return other
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             return self
         if isinstance(self, Neg):
             return Sub(other, self.arg)
@@ -183,9 +173,9 @@ class LExpr(LNode):
     def __sub__(self, other):
         """Subtract."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             return -other
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             return self
         if isinstance(other, Neg):
             return Add(self, other.arg)
@@ -196,9 +186,9 @@ class LExpr(LNode):
     def __rsub__(self, other):
         """Subtract."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             return other
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             return -self
         if isinstance(self, Neg):
             return Add(other, self.arg)
@@ -207,17 +197,18 @@ class LExpr(LNode):
     def __mul__(self, other):
         """Multiply."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        a, b = special_literal_value(self), special_literal_value(other)
+        if a == 0:
             return self
-        if is_zero_lexpr(other):
+        if b == 0:
             return other
-        if is_one_lexpr(self):
+        if a == 1:
             return other
-        if is_one_lexpr(other):
+        if b == 1:
             return self
-        if is_negative_one_lexpr(other):
+        if b == -1:
             return Neg(self)
-        if is_negative_one_lexpr(self):
+        if a == -1:
             return Neg(other)
         if isinstance(self, LiteralInt) and isinstance(other, LiteralInt):
             return LiteralInt(self.value * other.value)
@@ -226,35 +217,36 @@ class LExpr(LNode):
     def __rmul__(self, other):
         """Multiply."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        a, b = special_literal_value(self), special_literal_value(other)
+        if a == 0:
             return self
-        if is_zero_lexpr(other):
+        if b == 0:
             return other
-        if is_one_lexpr(self):
+        if a == 1:
             return other
-        if is_one_lexpr(other):
+        if b == 1:
             return self
-        if is_negative_one_lexpr(other):
+        if b == -1:
             return Neg(self)
-        if is_negative_one_lexpr(self):
+        if a == -1:
             return Neg(other)
         return Mul(other, self)
 
     def __div__(self, other):
         """Divide."""
         other = as_lexpr(other)
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             raise ValueError("Division by zero!")
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             return self
         return Div(self, other)
 
     def __rdiv__(self, other):
         """Divide."""
         other = as_lexpr(other)
-        if is_zero_lexpr(self):
+        if special_literal_value(self) == 0:
             raise ValueError("Division by zero!")
-        if is_zero_lexpr(other):
+        if special_literal_value(other) == 0:
             return other
         return Div(other, self)
 
@@ -482,9 +474,7 @@ class NaryOp(LExprOperator):
     def __init__(self, args):
         """Initialise."""
         self.args = [as_lexpr(arg) for arg in args]
-        self.dtype = self.args[0].dtype
-        for arg in self.args:
-            self.dtype = merge_dtypes([self.dtype, arg.dtype])
+        self.dtype = merge_dtypes([arg.dtype for arg in self.args])
 
     def __eq__(self, other):
         """Check equality."""
@@ -742,7 +732,7 @@ class ArrayAccess(LExprOperator):
 
     def __repr__(self):
         """Representation."""
-        return str(self.array) + "[" + ", ".join(str(i) for i in self.indices) + "]"
+        return f"{self.array}[{', '.join(map(str, self.indices))}]"
 
 
 class Conditional(LExprOperator):
@@ -1067,6 +1057,25 @@ def _math_function(op, *args):
     return MathFunction(name, args)
 
 
+def _power(op, base, exponent):
+    """Get a power, evaluating or unrolling integer exponents where possible."""
+    n = None
+    if isinstance(exponent, LiteralInt):
+        n = int(exponent.value)
+    elif isinstance(exponent, LiteralFloat) and isinstance(exponent.value, float):
+        if exponent.value.is_integer():
+            n = int(exponent.value)
+
+    if n is not None:
+        if isinstance(base, LiteralFloat | LiteralInt) and not isinstance(base.value, complex):
+            if base.value != 0 or n >= 0:
+                return LiteralFloat(float(base.value) ** n)
+        if 2 <= abs(n) <= 3 and isinstance(base, Symbol | ArrayAccess):
+            product = Product([base] * abs(n))
+            return product if n > 0 else Div(LiteralFloat(1.0), product)
+    return _math_function(op, base, exponent)
+
+
 # Lookup table for handler to call when the ufl_to_lnodes method (below) is
 # called, depending on the first argument type.
 _ufl_call_lookup = {
@@ -1078,7 +1087,7 @@ _ufl_call_lookup = {
     ufl.algebra.Sum: lambda x, a, b: a + b,
     ufl.algebra.Division: lambda x, a, b: a / b,
     ufl.algebra.Abs: _math_function,
-    ufl.algebra.Power: _math_function,
+    ufl.algebra.Power: _power,
     ufl.algebra.Real: _math_function,
     ufl.algebra.Imag: _math_function,
     ufl.algebra.Conj: _math_function,
@@ -57,10 +57,11 @@ def fuse_sections(code: list[L.LNode], name: str) -> list[L.LNode]:
                 output.extend(section.output)
                 annotations = section.annotations
 
-    # Remove duplicated inputs
-    input = list(set(input))
+    # Remove duplicated inputs, keeping the order so that the generated
+    # code does not depend on hash randomisation
+    input = list(dict.fromkeys(input))
     # Remove duplicated outputs
-    output = list(set(output))
+    output = list(dict.fromkeys(output))
 
     section = L.Section(name, statements, declarations, input, output, annotations)
 
@@ -178,6 +179,7 @@ def licm(section: L.Section, quadrature_rule: QuadratureRule) -> L.Section:
             expressions[lhs].append(rhs)
 
     pre_loop: list[L.LNode] = []
+    hoisted: list[L.LNode] = []
     for lhs, rhs in expressions.items():
         for r in rhs:
             hoist_candidates = []
@@ -196,14 +198,16 @@ def licm(section: L.Section, quadrature_rule: QuadratureRule) -> L.Section:
                 r.args.append(L.ArrayAccess(temp, [outer_loop.index]))
                 # create code for hoisted term
                 size = outer_loop.end.value - outer_loop.begin.value
-                pre_loop.append(L.ArrayDecl(temp, size, [0]))
-                body = L.Assign(
-                    L.ArrayAccess(temp, [outer_loop.index]), L.Product(hoist_candidates)
-                )
-                pre_loop.append(
-                    L.ForRange(outer_loop.index, outer_loop.begin, outer_loop.end, [body])
+                # Every entry is assigned in the hoisted loop, so no zero initialisation
+                pre_loop.append(L.ArrayDecl(temp, size))
+                hoisted.append(
+                    L.Assign(L.ArrayAccess(temp, [outer_loop.index]), L.Product(hoist_candidates))
                 )
 
+    # Compute all hoisted terms in a single pass over the outer index
+    if hoisted:
+        pre_loop.append(L.ForRange(outer_loop.index, outer_loop.begin, outer_loop.end, hoisted))
+
     section.statements = pre_loop + section.statements
 
     return section
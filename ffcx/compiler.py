@@ -80,7 +80,7 @@ logger = logging.getLogger("ffcx")
 
 
 def _print_timing(stage: int, timing: float) -> None:
-    logger.info(f"Compiler stage {stage} finished in {timing:.4f} seconds.")
+    logger.info("Compiler stage %s finished in %.4f seconds.", stage, timing)
 
 
 def compile_ufl_objects(
@@ -16,7 +16,7 @@ ufcx_utils.
 from __future__ import annotations
 
 import logging
-import os
+from pathlib import Path
 
 from ffcx.codegeneration.codegeneration import CodeBlocks
 
@@ -29,11 +29,8 @@ def format_code(code: CodeBlocks) -> tuple[str, str]:
     logger.info("Compiler stage 5: Formatting code")
     logger.info(79 * "*")
 
-    code_c = ""
-    code_h = ""
-    for parts_code in code:
-        code_h += "".join([c[0] for c in parts_code])
-        code_c += "".join([c[1] for c in parts_code])
+    code_h = "".join(c[0] for parts_code in code for c in parts_code)
+    code_c = "".join(c[1] for parts_code in code for c in parts_code)
 
     return code_h, code_c
 
@@ -45,7 +42,12 @@ def write_code(code_h: str, code_c: str, prefix: str, output_dir: str) -> None:
 
 
 def _write_file(output: str, prefix: str, postfix: str, output_dir: str) -> None:
-    """Write generated code to file."""
-    filename = os.path.join(output_dir, prefix + postfix)
-    with open(filename, "w") as hfile:
-        hfile.write(output)
+    """Write generated code to file.
+
+    The file is left untouched if it already has the same contents, so
+    that build systems do not recompile unchanged code.
+    """
+    filename = Path(output_dir) / (prefix + postfix)
+    if filename.is_file() and filename.read_text() == output:
+        return
+    filename.write_text(output)
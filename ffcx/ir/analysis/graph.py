@@ -47,8 +47,8 @@ class ExpressionGraph:
         if node1 not in self.nodes or node2 not in self.nodes:
             raise KeyError("Adding edge to unknown node")
 
-        self.out_edges[node1] += [node2]
-        self.in_edges[node2] += [node1]
+        self.out_edges[node1].append(node2)
+        self.in_edges[node2].append(node1)
 
 
 def build_graph_vertices(expressions, skip_terminal_modifiers=False) -> ExpressionGraph:
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 """Modified terminals."""
 
+import functools
 import logging
 
 from ufl.classes import (
@@ -29,6 +30,21 @@ logger = logging.getLogger("ffcx")
 class ModifiedTerminal:
     """A modified terminal."""
 
+    __slots__ = (
+        "_hash",
+        "averaged",
+        "base_shape",
+        "base_symmetry",
+        "component",
+        "expr",
+        "flat_component",
+        "global_derivatives",
+        "local_derivatives",
+        "reference_value",
+        "restriction",
+        "terminal",
+    )
+
     def __init__(
         self,
         expr,
@@ -87,6 +103,9 @@ class ModifiedTerminal:
         # Restriction to one cell or the other for interior facet integrals
         self.restriction = restriction
 
+        # The modified terminal is not changed after construction
+        self._hash = hash(self.as_tuple())
+
     def as_tuple(self):
         """Return a tuple with hashable values that uniquely identifies this modified terminal.
 
@@ -129,7 +148,7 @@ class ModifiedTerminal:
 
     def __hash__(self):
         """Hash."""
-        return hash(self.as_tuple())
+        return self._hash
 
     def __eq__(self, other):
         """Check equality."""
@@ -147,26 +166,41 @@ class ModifiedTerminal:
         )
 
 
-def is_modified_terminal(v):
-    """Check if v is a terminal or a terminal wrapped in terminal modifier types."""
-    while not v._ufl_is_terminal_:
-        if v._ufl_is_terminal_modifier_:
-            v = v.ufl_operands[0]
-        else:
-            return False
-    return True
-
-
 def strip_modified_terminal(v):
     """Extract core Terminal from a modified terminal or return None."""
     while not v._ufl_is_terminal_:
-        if v._ufl_is_terminal_modifier_:
-            v = v.ufl_operands[0]
-        else:
+        if not v._ufl_is_terminal_modifier_:
             return None
+        v = v.ufl_operands[0]
     return v
 
 
+def is_modified_terminal(v):
+    """Check if v is a terminal or a terminal wrapped in terminal modifier types."""
+    return strip_modified_terminal(v) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _intern_tuple(t):
+    """Return the first registered tuple equal to t."""
+    return t
+
+
+@functools.lru_cache(maxsize=256)
+def _component_numbering(base_shape):
+    """Build (and cache) the component numbering of a shape without symmetries."""
+    vi2si, _ = build_component_numbering(base_shape, {})
+    return vi2si
+
+
+@functools.lru_cache(maxsize=256)
+def _element_component_numbering(element, base_shape):
+    """Build (and cache) the component numbering of an element's value shape."""
+    vi2si, _ = build_component_numbering(base_shape, element.symmetry())
+    return vi2si
+
+
+@functools.lru_cache(maxsize=1024)
 def analyse_modified_terminal(expr):
     """Analyse a so-called 'modified terminal' expression.
 
@@ -178,7 +212,21 @@ def analyse_modified_terminal(expr):
     The wrapper types can include 0-* Grad or ReferenceGrad objects,
     and 0-1 ReferenceValue, 0-1 Restricted, 0-1 Indexed,
     and 0-1 FacetAvg or CellAvg objects.
+
+    The results are cached, since the same modified terminals recur
+    many times in the expression graph of a form. The returned object
+    is shared and must not be modified.
     """
+    # Fast path for plain terminals and indexed terminals, which are the
+    # most common and have no other modifiers to strip
+    if expr._ufl_is_terminal_:
+        return _complete_modified_terminal(expr, expr, False, (), (), (), None, None)
+    if type(expr) is Indexed:
+        t, i = expr.ufl_operands
+        if t._ufl_is_terminal_ and all(isinstance(j, FixedIndex) for j in i):
+            component = tuple(int(j) for j in i)
+            return _complete_modified_terminal(expr, t, False, component, (), (), None, None)
+
     # Data to determine
     component = None
     global_derivatives = []
@@ -273,6 +321,35 @@ def analyse_modified_terminal(expr):
     else:
         component = tuple(component)
 
+    return _complete_modified_terminal(
+        expr,
+        t,
+        reference_value,
+        component,
+        global_derivatives,
+        local_derivatives,
+        averaged,
+        restriction,
+    )
+
+
+def _complete_modified_terminal(
+    expr,
+    t,
+    reference_value,
+    component,
+    global_derivatives,
+    local_derivatives,
+    averaged,
+    restriction,
+):
+    """Flatten the component of an analysed modified terminal and build the ModifiedTerminal."""
+    # Share the few distinct component and derivative tuples between all
+    # modified terminals
+    component = _intern_tuple(component)
+    global_derivatives = _intern_tuple(global_derivatives)
+    local_derivatives = _intern_tuple(local_derivatives)
+
     # Get the shape of the core terminal or its reference value, this is
     # the shape that component refers to
     if isinstance(t, FormArgument):
@@ -282,23 +359,26 @@ def analyse_modified_terminal(expr):
             # to reference frame
             base_symmetry = {}
             base_shape = element.reference_value_shape
+            vi2si = _component_numbering(base_shape)
         else:
             base_symmetry = element.symmetry()
             base_shape = t.ufl_shape
+            vi2si = _element_component_numbering(element, base_shape)
     else:
         base_symmetry = {}
         base_shape = t.ufl_shape
+        vi2si = _component_numbering(base_shape)
 
     # Assert that component is within the shape of the (reference)
     # terminal
     if len(component) != len(base_shape):
         raise RuntimeError("Length of component does not match rank of (reference) terminal.")
-    if not all(c >= 0 and c < d for c, d in zip(component, base_shape)):
-        raise RuntimeError("Component indices {component} are outside value shape {base_shape}.")
 
-    # Flatten component
-    vi2si, _ = build_component_numbering(base_shape, base_symmetry)
-    flat_component = vi2si[component]
+    # Flatten component, the numbering contains exactly the components
+    # within the shape
+    flat_component = vi2si.get(component)
+    if flat_component is None:
+        raise RuntimeError(f"Component indices {component} are outside value shape {base_shape}.")
 
     return ModifiedTerminal(
         expr,
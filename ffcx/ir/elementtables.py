@@ -32,6 +32,10 @@ default_atol = 1e-9
 piecewise_ttypes = ("piecewise", "fixed", "ones", "zeros")
 uniform_ttypes = ("fixed", "ones", "zeros", "uniform")
 
+# Table name suffixes, see generate_psi_table_name
+_averaged_suffixes = {None: "", "cell": "_AC", "facet": "_AF"}
+_entity_type_suffixes = {"cell": "", "facet": "_F", "vertex": "_V", "ridge": "_R"}
+
 
 class ModifiedTerminalElement(typing.NamedTuple):
     """Modified terminal element."""
@@ -71,11 +75,19 @@ def equal_tables(a, b, rtol=default_rtol, atol=default_atol):
 def clamp_table_small_numbers(
     table, rtol=default_rtol, atol=default_atol, numbers=(-1.0, 0.0, 1.0)
 ):
-    """Clamp almost 0,1,-1 values to integers. Returns new table."""
+    """Clamp almost 0,1,-1 (or other) values to those numbers. Returns new table."""
     # Get shape of table and number of columns, defined as the last axis
     table = np.asarray(table)
-    for n in numbers:
-        table[np.where(np.isclose(table, n, rtol=rtol, atol=atol))] = n
+    numbers = np.asarray(numbers, dtype=float)
+    integers = numbers == np.rint(numbers)
+    # Compare each value with its nearest integer once, rather than the
+    # whole table with each integer in turn (adding 0.0 turns -0.0 into 0.0)
+    nearest = np.rint(table) + 0.0
+    mask = np.isin(nearest, numbers[integers]) & np.isclose(table, nearest, rtol=rtol, atol=atol)
+    table[mask] = nearest[mask]
+    # Any other numbers are compared with the whole table
+    for n in numbers[~integers]:
+        table[np.isclose(table, n, rtol=rtol, atol=atol)] = n
     return table
 
 
@@ -89,11 +101,16 @@ def get_ffcx_table_values(
     derivative_counts,
     flat_component,
     codim,
+    tabulation_cache: dict | None = None,
 ):
     """Extract values from FFCx element table.
 
     Returns a 3D numpy array with axes
     (entity number, quadrature point number, dof number)
+
+    If ``tabulation_cache`` is given, basis tabulations are stored in and
+    reused from it, so that tables for different derivatives or blocked
+    components of the same element are tabulated only once per point set.
     """
     deriv_order = sum(derivative_counts)
 
@@ -141,19 +158,36 @@ def get_ffcx_table_values(
     entity_dim = integral_type_to_entity_dim(integral_type, tdim)
     num_entities = cell.num_sub_entities(entity_dim)
 
-    # Extract arrays for the right scalar component
-    component_tables = []
+    # Tabulate the basis at the points of all entities in a single call
+    if codim == 0:
+        all_points = np.vstack(
+            [
+                map_integral_points(points, integral_type, cell, entity)
+                for entity in range(num_entities)
+            ]
+        )
+    elif codim == 1 or codim == 2:
+        # The points are the same for all entities
+        all_points = points
+    else:
+        raise RuntimeError("Codimension > 1 isn't supported.")
+
     component_element, offset, stride = element.get_component_element(flat_component)
-    for entity in range(num_entities):
-        if codim == 0:
-            entity_points = map_integral_points(points, integral_type, cell, entity)
-        elif codim == 1 or codim == 2:
-            entity_points = points
-        else:
-            raise RuntimeError("Codimension > 1 isn't supported.")
-        tbl = component_element.tabulate(deriv_order, entity_points)
-        tbl = tbl[basix_index(derivative_counts)]
-        component_tables.append(tbl)
+    if tabulation_cache is None:
+        tbl = component_element.tabulate(deriv_order, all_points)
+    else:
+        key = (component_element, deriv_order, all_points.shape, all_points.tobytes())
+        tbl = tabulation_cache.get(key)
+        if tbl is None:
+            tbl = component_element.tabulate(deriv_order, all_points)
+            tabulation_cache[key] = tbl
+    tbl = tbl[basix_index(derivative_counts)]
+
+    # Extract arrays for the right scalar component on each entity
+    if codim == 0:
+        component_tables = np.split(tbl, num_entities)
+    else:
+        component_tables = [tbl] * num_entities
 
     if avg in ("cell", "facet"):
         # Compute numeric integral of the each component table
@@ -205,9 +239,9 @@ def generate_psi_table_name(
     if flat_component is not None:
         name += f"_C{flat_component:d}"
     if any(derivative_counts):
-        name += "_D" + "".join(str(d) for d in derivative_counts)
-    name += {None: "", "cell": "_AC", "facet": "_AF"}[averaged]
-    name += {"cell": "", "facet": "_F", "vertex": "_V", "ridge": "_R"}[entity_type]
+        name += f"_D{''.join(map(str, derivative_counts))}"
+    name += _averaged_suffixes[averaged]
+    name += _entity_type_suffixes[entity_type]
     name += f"_Q{quadrature_rule.id()}"
     return name
 
@@ -278,44 +312,217 @@ def get_modified_terminal_element(mt) -> ModifiedTerminalElement | None:
 
 def permute_quadrature_interval(points, reflections=0):
     """Permute quadrature points for an interval."""
-    output = points.copy()
-    for p in output:
-        assert len(p) < 2 or np.isclose(p[1], 0)
-        assert len(p) < 3 or np.isclose(p[2], 0)
+    output = np.array(points, dtype=np.float64)
+    assert output.shape[1] < 2 or np.allclose(output[:, 1], 0)
+    assert output.shape[1] < 3 or np.allclose(output[:, 2], 0)
     for _ in range(reflections):
-        for n, p in enumerate(output):
-            output[n] = [1 - p[0]]
+        output[:] = 1 - output[:, :1]
     return output
 
 
 def permute_quadrature_triangle(points, reflections=0, rotations=0):
     """Permute quadrature points for a triangle."""
-    output = points.copy()
-    for p in output:
-        assert len(p) < 3 or np.isclose(p[2], 0)
+    output = np.array(points, dtype=np.float64)
+    assert output.shape[1] < 3 or np.allclose(output[:, 2], 0)
     for _ in range(rotations):
-        for n, p in enumerate(output):
-            output[n] = [p[1], 1 - p[0] - p[1]]
+        output[:] = np.column_stack((output[:, 1], 1 - output[:, 0] - output[:, 1]))
     for _ in range(reflections):
-        for n, p in enumerate(output):
-            output[n] = [p[1], p[0]]
+        output[:] = output[:, ::-1]
     return output
 
 
 def permute_quadrature_quadrilateral(points, reflections=0, rotations=0):
     """Permute quadrature points for a quadrilateral."""
-    output = points.copy()
-    for p in output:
-        assert len(p) < 3 or np.isclose(p[2], 0)
+    output = np.array(points, dtype=np.float64)
+    assert output.shape[1] < 3 or np.allclose(output[:, 2], 0)
     for _ in range(rotations):
-        for n, p in enumerate(output):
-            output[n] = [p[1], 1 - p[0]]
+        output[:] = np.column_stack((output[:, 1], 1 - output[:, 0]))
     for _ in range(reflections):
-        for n, p in enumerate(output):
-            output[n] = [p[1], p[0]]
+        output[:] = output[:, ::-1]
     return output
 
 
+def tabulate_modified_terminal_element(
+    quadrature_rule: QuadratureRule,
+    cell: ufl.Cell,
+    integral_type: str,
+    entity_type: entity_types,
+    is_mixed_dim: bool,
+    mte: ModifiedTerminalElement,
+    rtol: float = default_rtol,
+    atol: float = default_atol,
+    tabulation_cache: dict | None = None,
+):
+    """Tabulate and clean up the table of a modified terminal element.
+
+    Returns:
+        Tuple of the reduced table, its table type, whether it is permuted,
+        and the offset and stride of the component within the element.
+    """
+    element, avg, local_derivatives, flat_component = mte
+
+    tdim = cell.topological_dimension
+    codim = tdim - element.cell.topological_dimension
+    assert codim >= 0
+    if codim > 2:
+        raise RuntimeError("Codimension > 2 isn't supported.")
+
+    # Only permute quadrature rules for interior facets integrals and for
+    # the codim zero element in mixed-dimensional integrals. The latter is
+    # needed because a cell may see its sub-entities as being oriented
+    # differently to their global orientation
+    if (
+        integral_type == "interior_facet"
+        or integral_type == "ridge"
+        or (is_mixed_dim and codim == 0)
+    ):
+        if entity_type == "facet":
+            if tdim == 1 or codim == 1:
+                # Do not add permutations if codim-1 as facets have already gotten a global
+                # orientation in DOLFINx
+                t = get_ffcx_table_values(
+                    quadrature_rule.points,
+                    cell,
+                    integral_type,
+                    element,
+                    avg,
+                    entity_type,
+                    local_derivatives,
+                    flat_component,
+                    codim,
+                    tabulation_cache,
+                )
+            elif tdim == 2:
+                new_table = []
+                for ref in range(2):
+                    new_table.append(
+                        get_ffcx_table_values(
+                            permute_quadrature_interval(quadrature_rule.points, ref),
+                            cell,
+                            integral_type,
+                            element,
+                            avg,
+                            entity_type,
+                            local_derivatives,
+                            flat_component,
+                            codim,
+                            tabulation_cache,
+                        )
+                    )
+
+                t = new_table[0]
+                t["array"] = np.vstack([td["array"] for td in new_table])
+            elif tdim == 3:
+                cell_type = cell.cellname
+                if cell_type == "tetrahedron":
+                    new_table = []
+                    for rot in range(3):
+                        for ref in range(2):
+                            new_table.append(
+                                get_ffcx_table_values(
+                                    permute_quadrature_triangle(quadrature_rule.points, ref, rot),
+                                    cell,
+                                    integral_type,
+                                    element,
+                                    avg,
+                                    entity_type,
+                                    local_derivatives,
+                                    flat_component,
+                                    codim,
+                                    tabulation_cache,
+                                )
+                            )
+                    t = new_table[0]
+                    t["array"] = np.vstack([td["array"] for td in new_table])
+                elif cell_type == "hexahedron":
+                    new_table = []
+                    for rot in range(4):
+                        for ref in range(2):
+                            new_table.append(
+                                get_ffcx_table_values(
+                                    permute_quadrature_quadrilateral(
+                                        quadrature_rule.points, ref, rot
+                                    ),
+                                    cell,
+                                    integral_type,
+                                    element,
+                                    avg,
+                                    entity_type,
+                                    local_derivatives,
+                                    flat_component,
+                                    codim,
+                                    tabulation_cache,
+                                )
+                            )
+                    t = new_table[0]
+                    t["array"] = np.vstack([td["array"] for td in new_table])
+        elif entity_type == "ridge":
+            if tdim < 3 or codim == 2:
+                # If ridge integral over vertex no permutation is needed,
+                # or if it is a single domain ridge integral,
+                # as ridges has a global orientation in DOLFINx.
+                t = get_ffcx_table_values(
+                    quadrature_rule.points,
+                    cell,
+                    integral_type,
+                    element,
+                    avg,
+                    entity_type,
+                    local_derivatives,
+                    flat_component,
+                    codim,
+                    tabulation_cache,
+                )
+            else:
+                new_table = []
+                for ref in range(2):
+                    new_table.append(
+                        get_ffcx_table_values(
+                            permute_quadrature_interval(quadrature_rule.points, ref),
+                            cell,
+                            integral_type,
+                            element,
+                            avg,
+                            entity_type,
+                            local_derivatives,
+                            flat_component,
+                            codim,
+                            tabulation_cache,
+                        )
+                    )
+                t = new_table[0]
+                t["array"] = np.vstack([td["array"] for td in new_table])
+    else:
+        t = get_ffcx_table_values(
+            quadrature_rule.points,
+            cell,
+            integral_type,
+            element,
+            avg,
+            entity_type,
+            local_derivatives,
+            flat_component,
+            codim,
+            tabulation_cache,
+        )
+    # Clean up table
+    tbl = clamp_table_small_numbers(t["array"], rtol=rtol, atol=atol)
+    tabletype = analyse_table_type(tbl)
+
+    if tabletype in piecewise_ttypes:
+        # Reduce table to dimension 1 along num_points axis in generated code
+        tbl = tbl[:, :, :1, :]
+    if tabletype in uniform_ttypes:
+        # Reduce table to dimension 1 along num_entities axis in generated code
+        tbl = tbl[:, :1, :, :]
+    is_permuted = is_permuted_table(tbl)
+    if not is_permuted:
+        # Reduce table along num_perms axis
+        tbl = tbl[:1, :, :, :]
+
+    return tbl, tabletype, is_permuted, t["offset"], t["stride"]
+
+
 def build_optimized_tables(
     quadrature_rule: QuadratureRule,
     cell: ufl.Cell,
@@ -327,6 +534,7 @@ def build_optimized_tables(
     is_mixed_dim: bool,
     rtol: float = default_rtol,
     atol: float = default_atol,
+    tabulation_cache: dict[tuple, npt.NDArray[np.float64]] | None = None,
 ) -> dict[str | ModifiedTerminal, UniqueTableReferenceT]:
     """Build the element tables needed for a list of modified terminals.
 
@@ -341,6 +549,8 @@ def build_optimized_tables(
         is_mixed_dim: Mixed dimensionality of the domain.
         rtol: Relative tolerance for clamping tables to -1,0 or 1
         atol: Absolute tolerance for clamping tables to -1,0 or 1
+        tabulation_cache: Basis tabulations to reuse, see get_ffcx_table_values.
+            Can be shared between calls to reuse tabulations across integrals.
 
     Returns:
         Dictionary mapping each modified terminal to the a unique table reference.
@@ -355,20 +565,26 @@ def build_optimized_tables(
         if res:
             analysis[mt] = res
 
-    # Build element numbering using topological ordering so subelements
-    # get priority
-    all_elements = [res[0] for res in analysis.values()]
-    unique_elements = ufl.algorithms.sort_elements(
-        set(ufl.algorithms.analysis.extract_sub_elements(all_elements))
-    )
+    # Number the elements in order of first use. The numbers only serve to
+    # keep table names unique, so the sub-element tree is not traversed.
+    unique_elements = dict.fromkeys(res[0] for res in analysis.values())
     element_numbers = {element: i for i, element in enumerate(unique_elements)}
     mt_tables: dict[str | ModifiedTerminal, UniqueTableReferenceT] = {}
 
     _existing_tables = existing_tables.copy()
 
+    # Index the tables by shape, as only tables of the same shape can be equal
+    tables_by_shape: dict[tuple[int, ...], list[str]] = {}
+    for table_name, table in _existing_tables.items():
+        tables_by_shape.setdefault(np.shape(table), []).append(table_name)
+
     all_tensor_factors: list[UniqueTableReferenceT] = []
     tensor_n = 0
 
+    tabulated: dict[ModifiedTerminalElement, tuple] = {}
+    if tabulation_cache is None:
+        tabulation_cache = {}
+
     for mt in modified_terminals:
         res = analysis.get(mt)
         if not res:
@@ -383,168 +599,25 @@ def build_optimized_tables(
             quadrature_rule, element_number, avg, entity_type, local_derivatives, flat_component
         )
 
-        # FIXME - currently just recalculate the tables every time,
-        # only reusing them if they match numerically.
-        # It should be possible to reuse the cached tables by name, but
-        # the dofmap offset may differ due to restriction.
-
-        tdim = cell.topological_dimension
-        codim = tdim - element.cell.topological_dimension
-        assert codim >= 0
-        if codim > 2:
-            raise RuntimeError("Codimension > 2 isn't supported.")
-
-        # Only permute quadrature rules for interior facets integrals and for
-        # the codim zero element in mixed-dimensional integrals. The latter is
-        # needed because a cell may see its sub-entities as being oriented
-        # differently to their global orientation
-        if (
-            integral_type == "interior_facet"
-            or integral_type == "ridge"
-            or (is_mixed_dim and codim == 0)
-        ):
-            if entity_type == "facet":
-                if tdim == 1 or codim == 1:
-                    # Do not add permutations if codim-1 as facets have already gotten a global
-                    # orientation in DOLFINx
-                    t = get_ffcx_table_values(
-                        quadrature_rule.points,
-                        cell,
-                        integral_type,
-                        element,
-                        avg,
-                        entity_type,
-                        local_derivatives,
-                        flat_component,
-                        codim,
-                    )
-                elif tdim == 2:
-                    new_table = []
-                    for ref in range(2):
-                        new_table.append(
-                            get_ffcx_table_values(
-                                permute_quadrature_interval(quadrature_rule.points, ref),
-                                cell,
-                                integral_type,
-                                element,
-                                avg,
-                                entity_type,
-                                local_derivatives,
-                                flat_component,
-                                codim,
-                            )
-                        )
-
-                    t = new_table[0]
-                    t["array"] = np.vstack([td["array"] for td in new_table])
-                elif tdim == 3:
-                    cell_type = cell.cellname
-                    if cell_type == "tetrahedron":
-                        new_table = []
-                        for rot in range(3):
-                            for ref in range(2):
-                                new_table.append(
-                                    get_ffcx_table_values(
-                                        permute_quadrature_triangle(
-                                            quadrature_rule.points, ref, rot
-                                        ),
-                                        cell,
-                                        integral_type,
-                                        element,
-                                        avg,
-                                        entity_type,
-                                        local_derivatives,
-                                        flat_component,
-                                        codim,
-                                    )
-                                )
-                        t = new_table[0]
-                        t["array"] = np.vstack([td["array"] for td in new_table])
-                    elif cell_type == "hexahedron":
-                        new_table = []
-                        for rot in range(4):
-                            for ref in range(2):
-                                new_table.append(
-                                    get_ffcx_table_values(
-                                        permute_quadrature_quadrilateral(
-                                            quadrature_rule.points, ref, rot
-                                        ),
-                                        cell,
-                                        integral_type,
-                                        element,
-                                        avg,
-                                        entity_type,
-                                        local_derivatives,
-                                        flat_component,
-                                        codim,
-                                    )
-                                )
-                        t = new_table[0]
-                        t["array"] = np.vstack([td["array"] for td in new_table])
-            elif entity_type == "ridge":
-                if tdim < 3 or codim == 2:
-                    # If ridge integral over vertex no permutation is needed,
-                    # or if it is a single domain ridge integral,
-                    # as ridges has a global orientation in DOLFINx.
-                    t = get_ffcx_table_values(
-                        quadrature_rule.points,
-                        cell,
-                        integral_type,
-                        element,
-                        avg,
-                        entity_type,
-                        local_derivatives,
-                        flat_component,
-                        codim,
-                    )
-                else:
-                    new_table = []
-                    for ref in range(2):
-                        new_table.append(
-                            get_ffcx_table_values(
-                                permute_quadrature_interval(quadrature_rule.points, ref),
-                                cell,
-                                integral_type,
-                                element,
-                                avg,
-                                entity_type,
-                                local_derivatives,
-                                flat_component,
-                                codim,
-                            )
-                        )
-                    t = new_table[0]
-                    t["array"] = np.vstack([td["array"] for td in new_table])
-        else:
-            t = get_ffcx_table_values(
-                quadrature_rule.points,
+        # The table values only depend on the modified terminal element,
+        # so terminals that differ only by restriction share one tabulation
+        if res not in tabulated:
+            tabulated[res] = tabulate_modified_terminal_element(
+                quadrature_rule,
                 cell,
                 integral_type,
-                element,
-                avg,
                 entity_type,
-                local_derivatives,
-                flat_component,
-                codim,
+                is_mixed_dim,
+                res,
+                rtol,
+                atol,
+                tabulation_cache,
             )
-        # Clean up table
-        tbl = clamp_table_small_numbers(t["array"], rtol=rtol, atol=atol)
-        tabletype = analyse_table_type(tbl)
-
-        if tabletype in piecewise_ttypes:
-            # Reduce table to dimension 1 along num_points axis in generated code
-            tbl = tbl[:, :, :1, :]
-        if tabletype in uniform_ttypes:
-            # Reduce table to dimension 1 along num_entities axis in generated code
-            tbl = tbl[:, :1, :, :]
-        is_permuted = is_permuted_table(tbl)
-        if not is_permuted:
-            # Reduce table along num_perms axis
-            tbl = tbl[:1, :, :, :]
+        tbl, tabletype, is_permuted, component_offset, block_size = tabulated[res]
 
         # Check for existing identical table
         is_new_table = True
-        for table_name in _existing_tables:
+        for table_name in tables_by_shape.get(tbl.shape, []):
             # FIXME: should we pass in atol and rtol here?
             if equal_tables(tbl, _existing_tables[table_name]):
                 name = table_name
@@ -554,6 +627,7 @@ def build_optimized_tables(
 
         if is_new_table:
             _existing_tables[name] = tbl
+            tables_by_shape.setdefault(tbl.shape, []).append(name)
 
         cell_offset = 0
 
@@ -609,8 +683,7 @@ def build_optimized_tables(
             # offset = 0 or number of element dofs, if restricted to "-"
             cell_offset = element.dim
 
-        offset = cell_offset + t["offset"]
-        block_size = t["stride"]
+        offset = cell_offset + component_offset
         # tables is just np.arrays, mt_tables hold metadata too
         # FIXME: type-hinting of tensor factors is not correct
         mt_tables[mt] = UniqueTableReferenceT(
@@ -630,6 +703,20 @@ def build_optimized_tables(
     return mt_tables
 
 
+def is_quadrature_coefficient(mt, tabledata, quadrature_rule) -> bool:
+    """Check if a coefficient can be read directly from its dofs at each point.
+
+    This is the case for coefficients in quadrature spaces evaluated at
+    their own points, where the (unpermuted) table is the identity.
+    """
+    return (
+        isinstance(mt.terminal, ufl.classes.Coefficient)
+        and tabledata.ttype == "quadrature"
+        and not tabledata.is_permuted
+        and not (quadrature_rule and quadrature_rule.has_tensor_factors)
+    )
+
+
 def is_zeros_table(table, rtol=default_rtol, atol=default_atol):
     """Check if table values are all zero."""
     return np.prod(table.shape) == 0 or np.allclose(
@@ -644,35 +731,24 @@ def is_ones_table(table, rtol=default_rtol, atol=default_atol):
 
 def is_quadrature_table(table, rtol=default_rtol, atol=default_atol):
     """Check if table is a quadrature table."""
-    _, num_entities, num_points, num_dofs = table.shape
+    _, _, num_points, num_dofs = table.shape
     Id = np.eye(num_points)
-    return num_points == num_dofs and all(
-        np.allclose(table[0, i, :, :], Id, rtol=rtol, atol=atol) for i in range(num_entities)
-    )
+    return num_points == num_dofs and np.allclose(table[0, :, :, :], Id, rtol=rtol, atol=atol)
 
 
 def is_permuted_table(table, rtol=default_rtol, atol=default_atol):
     """Check if table is permuted."""
-    return not all(
-        np.allclose(table[0, :, :, :], table[i, :, :, :], rtol=rtol, atol=atol)
-        for i in range(1, table.shape[0])
-    )
+    return not np.allclose(table[:1, :, :, :], table[1:, :, :, :], rtol=rtol, atol=atol)
 
 
 def is_piecewise_table(table, rtol=default_rtol, atol=default_atol):
     """Check if table is piecewise."""
-    return all(
-        np.allclose(table[0, :, 0, :], table[0, :, i, :], rtol=rtol, atol=atol)
-        for i in range(1, table.shape[2])
-    )
+    return np.allclose(table[0, :, :1, :], table[0, :, 1:, :], rtol=rtol, atol=atol)
 
 
 def is_uniform_table(table, rtol=default_rtol, atol=default_atol):
     """Check if table is uniform."""
-    return all(
-        np.allclose(table[0, 0, :, :], table[0, i, :, :], rtol=rtol, atol=atol)
-        for i in range(1, table.shape[1])
-    )
+    return np.allclose(table[0, :1, :, :], table[0, 1:, :, :], rtol=rtol, atol=atol)
 
 
 def analyse_table_type(table, rtol=default_rtol, atol=default_atol):
@@ -28,7 +28,11 @@ from ffcx.ir.analysis.modified_terminals import (
     is_modified_terminal,
 )
 from ffcx.ir.analysis.visualise import visualise_graph
-from ffcx.ir.elementtables import UniqueTableReferenceT, build_optimized_tables
+from ffcx.ir.elementtables import (
+    UniqueTableReferenceT,
+    build_optimized_tables,
+    is_quadrature_coefficient,
+)
 from ffcx.ir.representationutils import QuadratureRule
 
 logger = logging.getLogger("ffcx")
@@ -111,6 +115,7 @@ def compute_integral_ir(
     argument_shape: tuple[int],
     p: dict,
     visualise: bool,
+    tabulation_cache: dict | None = None,
 ):
     """Compute intermediate representation for an integral.
 
@@ -123,6 +128,7 @@ def compute_integral_ir(
         p: Parameters used for clamping tables and for activating sum factorization
         visualise: If True, store the graph representation of the integrand in a pdf file
             `S.pdf` and `F.pdf`
+        tabulation_cache: Basis tabulations shared with other integrals
     """
     # The intermediate representation dict we're building and returning
     # here
@@ -178,6 +184,7 @@ def compute_integral_ir(
                 is_mixed_dim=is_mixed_dim,
                 rtol=p["table_rtol"],
                 atol=p["table_atol"],
+                tabulation_cache=tabulation_cache,
             )
 
             # Fetch unique tables for this quadrature rule
@@ -236,20 +243,15 @@ def compute_integral_ir(
                 # components
                 assert len(F.nodes[fi]["target"]) == len(F.nodes[fi]["component"])
 
-                k = 0
-                for w in F.nodes[fi]["target"]:
-                    comp = F.nodes[fi]["component"][k]
-                    argument_factorization[w] = argument_factorization.get(w, [])
-
+                for w, comp in zip(F.nodes[fi]["target"], F.nodes[fi]["component"]):
                     # Store tuple of (factor index, component index)
-                    argument_factorization[w].append((fi, comp))
-                    k += 1
+                    argument_factorization.setdefault(w, []).append((fi, comp))
 
             # Get list of indices in F which are the arguments (should be at start)
             _argkeys: set[int] = set()
             for w in argument_factorization:
-                _argkeys = _argkeys | set(w)
-            argkeys = list(_argkeys)
+                _argkeys.update(w)
+            argkeys = sorted(_argkeys)
 
             # Build set of modified_terminals for each mt factorized vertex in F
             # and attach tables, if appropriate
@@ -288,7 +290,7 @@ def compute_integral_ir(
                     assert begin is not None
                     num_dofs = tr.values.shape[3]
                     assert tr.block_size is not None
-                    dofmap = tuple(begin + i * tr.block_size for i in range(num_dofs))
+                    dofmap = tuple(range(begin, begin + num_dofs * tr.block_size, tr.block_size))
                     _blockmap.append(dofmap)
                 blockmap = tuple(_blockmap)
 
@@ -338,6 +340,9 @@ def compute_integral_ir(
             for i, v in F.nodes.items():
                 tr = v.get("tr")
                 if tr is not None and F.nodes[i]["status"] != "inactive":
+                    if is_quadrature_coefficient(v["mt"], tr, quadrature_rule):
+                        # Accessed directly from the dofs, see codegeneration
+                        continue
                     if tr.has_tensor_factorisation:
                         assert tr.tensor_factors is not None
                         for t in tr.tensor_factors:
@@ -216,10 +216,14 @@ def _compute_integral_ir(
         "ridge": "ridge",
     }
 
+    # Basis tabulations are shared by all integrals of the form, e.g.
+    # the same integrand over several subdomains
+    tabulation_cache: dict = {}
+
     # Iterate over groups of integrals
     irs = []
     for itg_data_index, itg_data in enumerate(form_data.integral_data):
-        logger.info(f"Computing IR for integral in integral group {itg_data_index}")
+        logger.info("Computing IR for integral in integral group %s", itg_data_index)
         expression_ir = {}
 
         # Compute representation
@@ -407,6 +411,7 @@ def _compute_integral_ir(
             expression_ir["tensor_shape"],
             options,
             visualise,
+            tabulation_cache,
         )
 
         expression_ir.update(integral_ir)
@@ -430,7 +435,7 @@ def _compute_form_ir(
     tensor_part: TensorPart,
 ) -> FormIR:
     """Compute intermediate representation of form."""
-    logger.info(f"Computing IR for form {form_id}")
+    logger.info("Computing IR for form %s", form_id)
 
     # Store id
     ir = {"id": form_id}
@@ -438,15 +443,18 @@ def _compute_form_ir(
     # Compute common data
     ir["name"] = form_names[form_id]
 
-    ir["signature"] = form_data.original_form.signature()
-    args = form_data.original_form.arguments()
+    original_form = form_data.original_form
+    constants = original_form.constants()
+
+    ir["signature"] = original_form.signature()
+    args = original_form.arguments()
     if tensor_part == TensorPart.diagonal and len(args) == 2:
         assert args[0].ufl_function_space() == args[1].ufl_function_space(), (
             "Can only diagonalise forms with identical arguments."
         )
         ir["rank"] = 1
     else:
-        ir["rank"] = len(form_data.original_form.arguments())
+        ir["rank"] = len(args)
 
     ir["num_coefficients"] = len(form_data.reduced_coefficients)
 
@@ -454,14 +462,11 @@ def _compute_form_ir(
         object_names.get(id(obj), f"w{j}") for j, obj in enumerate(form_data.reduced_coefficients)
     ]
 
-    ir["num_constants"] = len(form_data.original_form.constants())
-    ir["constant_ranks"] = [len(obj.ufl_shape) for obj in form_data.original_form.constants()]
-    ir["constant_shapes"] = [obj.ufl_shape for obj in form_data.original_form.constants()]
+    ir["num_constants"] = len(constants)
+    ir["constant_ranks"] = [len(obj.ufl_shape) for obj in constants]
+    ir["constant_shapes"] = [obj.ufl_shape for obj in constants]
 
-    ir["constant_names"] = [
-        object_names.get(id(obj), f"c{j}")
-        for j, obj in enumerate(form_data.original_form.constants())
-    ]
+    ir["constant_names"] = [object_names.get(id(obj), f"c{j}") for j, obj in enumerate(constants)]
 
     ir["original_coefficient_positions"] = form_data.original_coefficient_positions
 
@@ -469,7 +474,7 @@ def _compute_form_ir(
         e.basix_hash() for e in form_data.argument_elements + form_data.coefficient_elements
     ]
 
-    form_name = object_names.get(id(form_data.original_form), form_id)
+    form_name = object_names.get(id(original_form), form_id)
 
     ir["name_from_uflfile"] = f"form_{prefix}_{form_name}"
 
@@ -489,10 +494,9 @@ def _compute_form_ir(
         if min(subdomain_ids) < -1:
             raise ValueError("Integral subdomain IDs must be non-negative.")
         ir["subdomain_ids"][integral_type] += subdomain_ids
-        for _ in range(len(subdomain_ids)):
-            iname = integral_names[(form_id, itg_index)]
-            ir["integral_names"][integral_type] += [iname]
-            ir["integral_domains"][integral_type] += [integral_domains[iname]]
+        iname = integral_names[(form_id, itg_index)]
+        ir["integral_names"][integral_type] += [iname] * len(subdomain_ids)
+        ir["integral_domains"][integral_type] += [integral_domains[iname]] * len(subdomain_ids)
 
     return FormIR(**ir)
 
@@ -507,7 +511,7 @@ def _compute_expression_ir(
     object_names,
 ):
     """Compute intermediate representation of an Expression."""
-    logger.info(f"Computing IR for Expression {index}")
+    logger.info("Computing IR for Expression %s", index)
 
     # Compute representation
     ir = {}
@@ -118,7 +118,8 @@ def get_options(
         options.update(priority_options)
 
     logger.setLevel(int(options["verbosity"]))  # type: ignore
-    logger.info("Final option values")
-    logger.info(pprint.pformat(options))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Final option values")
+        logger.info(pprint.pformat(options))
 
     return options
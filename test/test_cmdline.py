@@ -16,6 +16,14 @@ def test_cmdline_simple():
     subprocess.run(["ffcx", "Poisson.py"], check=True)
 
 
+def test_cmdline_unchanged_output_not_rewritten():
+    os.chdir(os.path.dirname(__file__))
+    subprocess.run(["ffcx", "Poisson.py"], check=True)
+    mtimes = {f: os.stat(f).st_mtime_ns for f in ("Poisson.h", "Poisson.c")}
+    subprocess.run(["ffcx", "Poisson.py"], check=True)
+    assert mtimes == {f: os.stat(f).st_mtime_ns for f in ("Poisson.h", "Poisson.c")}
+
+
 def test_visualise():
     try:
         import pygraphviz  # noqa: F401
@@ -355,6 +355,59 @@ def test_form_coefficient(compile_args):
     assert np.isclose(A_diff.min(), 0.0)
 
 
+@pytest.mark.parametrize("value_shape", [(), (2,)])
+def test_quadrature_element_coefficient(compile_args, value_shape):
+    element = basix.ufl.element("Lagrange", "triangle", 1)
+    domain = ufl.Mesh(basix.ufl.element("Lagrange", "triangle", 1, shape=(2,)))
+    space = ufl.FunctionSpace(domain, element)
+    q_element = basix.ufl.quadrature_element("triangle", value_shape=value_shape, degree=2)
+    q_space = ufl.FunctionSpace(domain, q_element)
+    u, v = ufl.TrialFunction(space), ufl.TestFunction(space)
+    f = ufl.Coefficient(q_space)
+    dx = ufl.dx(metadata={"quadrature_degree": 2})
+    if value_shape == ():
+        a = f * ufl.inner(ufl.grad(u), ufl.grad(v)) * dx
+    else:
+        a = ufl.inner(f, ufl.grad(u)) * v * dx
+    compiled_forms, module, _code = ffcx.codegeneration.jit.compile_forms(
+        [a], cffi_extra_compile_args=compile_args
+    )
+
+    points, weights = basix.make_quadrature(basix.CellType.triangle, 2)
+    tab = basix.create_element(
+        basix.ElementFamily.P, basix.CellType.triangle, 1, basix.LagrangeVariant.equispaced
+    ).tabulate(1, points)
+    phi, dphi = tab[0, :, :, 0], tab[1:, :, :, 0]
+
+    # Coefficient values at the quadrature points, blocked by point
+    rng = np.random.default_rng(0)
+    w = rng.random(len(weights) * int(np.prod(value_shape)))
+    if value_shape == ():
+        A_expected = np.einsum("q,q,kqi,kqj->ij", weights, w, dphi, dphi)
+    else:
+        fq = w.reshape(len(weights), *value_shape)
+        A_expected = np.einsum("q,qi,qk,kqj->ij", weights, phi, fq, dphi)
+
+    form0 = compiled_forms[0].form_integrals[0]
+    A = np.zeros((3, 3), dtype=np.float64)
+    c = np.array([], dtype=np.float64)
+    coords = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float64)
+
+    ffi = module.ffi
+    kernel = getattr(form0, "tabulate_tensor_float64")
+    kernel(
+        ffi.cast("double  *", A.ctypes.data),
+        ffi.cast("double  *", w.ctypes.data),
+        ffi.cast("double  *", c.ctypes.data),
+        ffi.cast("double  *", coords.ctypes.data),
+        ffi.NULL,
+        ffi.NULL,
+        ffi.NULL,
+    )
+
+    assert np.allclose(A, A_expected)
+
+
 def test_subdomains(compile_args):
     element = basix.ufl.element("Lagrange", "triangle", 1)
     domain = ufl.Mesh(basix.ufl.element("Lagrange", "triangle", 1, shape=(2,)))
@@ -461,6 +514,101 @@ def test_interior_facet_integral(dtype, compile_args):
     )
 
 
+def test_point_invariant_and_varying_blocks(compile_args):
+    P1 = basix.ufl.element("Lagrange", "triangle", 1)
+    P2 = basix.ufl.element("Lagrange", "triangle", 2)
+    domain = ufl.Mesh(basix.ufl.element("Lagrange", "triangle", 1, shape=(2,)))
+    space = ufl.FunctionSpace(domain, basix.ufl.mixed_element([P1, P2]))
+    u1, u2 = ufl.split(ufl.TrialFunction(space))
+    v1, v2 = ufl.split(ufl.TestFunction(space))
+
+    # Use the same quadrature rule for the P1 stiffness and P2 mass terms
+    dx = ufl.dx(metadata={"quadrature_degree": 4})
+    dS = ufl.dS(metadata={"quadrature_degree": 4})
+    a0 = ufl.inner(ufl.grad(u1), ufl.grad(v1)) * dx + u2 * v2 * dx
+    a1 = (
+        ufl.inner(ufl.jump(ufl.grad(u1)), ufl.jump(ufl.grad(v1))) * dS
+        + ufl.avg(u2) * ufl.avg(v2) * dS
+    )
+    forms = [a0, a1]
+    compiled_forms, module, (_, impl) = ffcx.codegeneration.jit.compile_forms(
+        forms, cffi_extra_compile_args=compile_args
+    )
+
+    # In both kernels the stiffness block is integrated before the
+    # quadrature loop and the mass block inside it
+    assert impl.count("Blocks integrated outside of the quadrature loop") == 2
+    assert impl.count("for (int iq = 0;") == 2
+
+    ffi = module.ffi
+    c = np.array([], dtype=np.float64)
+    w = np.array([], dtype=np.float64)
+    p2 = basix.create_element(
+        basix.ElementFamily.P, basix.CellType.triangle, 2, basix.LagrangeVariant.equispaced
+    )
+
+    # Cell integral on the reference triangle
+    A = np.zeros((9, 9), dtype=np.float64)
+    coords = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float64)
+    kernel = getattr(compiled_forms[0].form_integrals[0], "tabulate_tensor_float64")
+    kernel(
+        ffi.cast("double  *", A.ctypes.data),
+        ffi.cast("double  *", w.ctypes.data),
+        ffi.cast("double  *", c.ctypes.data),
+        ffi.cast("double  *", coords.ctypes.data),
+        ffi.NULL,
+        ffi.NULL,
+        ffi.NULL,
+    )
+    points, weights = basix.make_quadrature(basix.CellType.triangle, 4)
+    phi = p2.tabulate(0, points)[0, :, :, 0]
+    A_expected = np.zeros((9, 9))
+    A_expected[:3, :3] = np.array([[2.0, -1.0, -1.0], [-1.0, 1.0, 0.0], [-1.0, 0.0, 1.0]]) / 2.0
+    A_expected[3:, 3:] = np.einsum("q,qi,qj->ij", weights, phi, phi)
+    assert np.allclose(A, A_expected)
+
+    # Interior facet between the cells (0,0),(1,0),(0,1) and (1,0),(0,1),(1,1),
+    # which is facet 0 of the first and facet 2 of the second cell
+    A = np.zeros((18, 18), dtype=np.float64)
+    coords = np.array(
+        [
+            [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0],
+        ],
+        dtype=np.float64,
+    )
+    facets = np.array([0, 2], dtype=np.intc)
+    perms = np.array([0, 0], dtype=np.uint8)
+    kernel = getattr(compiled_forms[1].form_integrals[0], "tabulate_tensor_float64")
+    kernel(
+        ffi.cast("double  *", A.ctypes.data),
+        ffi.cast("double  *", w.ctypes.data),
+        ffi.cast("double  *", c.ctypes.data),
+        ffi.cast("double  *", coords.ctypes.data),
+        ffi.cast("int *", facets.ctypes.data),
+        ffi.cast("uint8_t *", perms.ctypes.data),
+        ffi.NULL,
+    )
+
+    # The facet point x = (1 - s, s) is (1 - s, s) on the reference cell of
+    # the first cell and (s, 0) on that of the second
+    s, ws = basix.make_quadrature(basix.CellType.interval, 4)
+    s = s[:, 0]
+    zero = np.zeros_like(s)
+    phi_p = p2.tabulate(0, np.stack([1.0 - s, s], axis=1))[0, :, :, 0]
+    phi_m = p2.tabulate(0, np.stack([s, zero], axis=1))[0, :, :, 0]
+    length = np.sqrt(2.0)
+    avg = np.zeros((len(s), 18))
+    avg[:, 3:9] = phi_p / 2.0
+    avg[:, 12:18] = phi_m / 2.0
+    grad_jump = np.zeros((18, 2))
+    grad_jump[:3] = [[-1.0, -1.0], [1.0, 0.0], [0.0, 1.0]]
+    grad_jump[9:12] = [[0.0, 1.0], [1.0, 0.0], [-1.0, -1.0]]
+    A_expected = length * grad_jump @ grad_jump.T
+    A_expected += length * np.einsum("q,qi,qj->ij", ws, avg, avg)
+    assert np.allclose(A, A_expected)
+
+
 @pytest.mark.parametrize(
     "dtype",
     [
@@ -1,7 +1,9 @@
 import importlib
 
+import basix.ufl
 import numpy as np
 import pytest
+import ufl
 from cffi import FFI
 
 from ffcx.codegeneration import lnodes as L
@@ -102,3 +104,53 @@ def test_gemv(dtype):
 
     gemv(py, pA, px)
     assert np.all(y == result)
+
+
+def test_power():
+    # Test LNodes integer powers, which are unrolled or evaluated where possible
+    mesh = ufl.Mesh(basix.ufl.element("Lagrange", "triangle", 1, shape=(2,)))
+    op = ufl.algebra.Power(ufl.SpatialCoordinate(mesh)[0], ufl.as_ufl(0.5))
+
+    x = L.Symbol("x", dtype=L.DataType.REAL)
+    xs = 1.7
+    cases = [
+        (x, L.LiteralInt(2), xs**2),
+        (x, L.LiteralInt(3), xs**3),
+        (x, L.LiteralInt(-2), xs**-2),
+        (x, L.LiteralFloat(-3.0), xs**-3),
+        (x, L.LiteralInt(4), xs**4),
+        (x, L.LiteralFloat(0.5), xs**0.5),
+        (L.LiteralFloat(3.0), L.LiteralInt(-2), 3.0**-2),
+        (L.LiteralInt(2), L.LiteralFloat(3.0), 8.0),
+        (L.LiteralFloat(0.0), L.LiteralInt(-2), np.inf),
+    ]
+    powers = [L.ufl_to_lnodes(op, base, exponent) for base, exponent, _ in cases]
+
+    # Small integer exponents are unrolled, literals are folded, except for
+    # negative powers of zero which are left to C
+    Q = CFormatter(dtype="float64")
+    assert [Q.c_format(p) for p in powers[:4]] == [
+        "x * x",
+        "x * x * x",
+        "1.0 / (x * x)",
+        "1.0 / (x * x * x)",
+    ]
+    assert all(isinstance(p, L.MathFunction) for p in powers[4:6])
+    assert [p.value for p in powers[6:8]] == [3.0**-2, 8.0]
+    assert isinstance(powers[8], L.MathFunction)
+
+    # Format into C and compile with CFFI
+    y = L.Symbol("y", dtype=L.DataType.REAL)
+    code = [L.Assign(y[i], p) for i, p in enumerate(powers)]
+    decl = "void power(double *y, double x)"
+    c_code = "#include <math.h>\n" + decl + "{\n" + Q.c_format(L.StatementList(code)) + "\n}\n"
+
+    ffibuilder = FFI()
+    ffibuilder.cdef(decl + ";")
+    ffibuilder.set_source("_power", c_code)
+    ffibuilder.compile(verbose=True)
+    _power = importlib.import_module("_power")
+
+    result = np.zeros(len(cases))
+    _power.lib.power(_power.ffi.cast("double *", result.ctypes.data), xs)
+    assert np.allclose(result, [expected for _, _, expected in cases])